@@ -1,7 +1,29 @@
 from django.contrib import admin
-from django.db import models
+from django.core.paginator import Paginator
+from django.db import connection, models
+from django.db.models.functions import Concat
+from django.utils.functional import cached_property
 from .models import Book
 
+
+class LargeTablePaginator(Paginator):
+    """Paginator using PostgreSQL's reltuples estimate for unfiltered book lists."""
+    
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where and connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [query.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] > 0:
+                return row[0]
+        return super().count
+
+
 @admin.register(Book)
 class BookAdmin(admin.ModelAdmin):
     """Admin configuration for the Book model."""
@@ -21,6 +43,10 @@ class BookAdmin(admin.ModelAdmin):
     # Number of items per page in the admin list view
     list_per_page = 20
     
+    # Skip the unfiltered COUNT(*) and estimate large table sizes
+    show_full_result_count = False
+    paginator = LargeTablePaginator
+    
     # Enable date hierarchy (if we had a date field)
     # date_hierarchy = 'publication_year'
     
@@ -36,6 +62,15 @@ class BookAdmin(admin.ModelAdmin):
     
     def mark_as_classic(self, request, queryset):
         """Custom action to mark books as classics (example)."""
-        updated = queryset.update(title=models.F('title') + ' (Classic)')
+        # Update by primary key so the UPDATE doesn't carry the changelist's
+        # filters/annotations, and concatenate in SQL without loading rows.
+        # Books already marked are skipped so re-running the action is a no-op.
+        pks = list(queryset.values_list('pk', flat=True))
+        updated = (
+            Book.objects
+            .filter(pk__in=pks)
+            .exclude(title__endswith=' (Classic)')
+            .update(title=Concat('title', models.Value(' (Classic)')))
+        )
         self.message_user(request, f'{updated} book(s) marked as classic.')
     mark_as_classic.short_description = "Mark selected books as classics"
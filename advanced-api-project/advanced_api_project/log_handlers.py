@@ -0,0 +1,21 @@
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class BackgroundStreamHandler(QueueHandler):
+    """
+    Logging handler that writes records to stderr from a background thread.
+    
+    The request thread only formats the record and puts it on an in-memory
+    queue; a QueueListener thread does the actual stream write, so logging
+    from views never blocks a request on I/O. Usable from LOGGING via
+    `'class': 'advanced_api_project.log_handlers.BackgroundStreamHandler'`.
+    """
+    
+    def __init__(self, stream=None):
+        super().__init__(queue.SimpleQueue())
+        self.listener = QueueListener(self.queue, logging.StreamHandler(stream))
+        self.listener.start()
+        atexit.register(self.listener.stop)
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -79,10 +80,38 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Keep connections open across requests for up to a minute instead of
+        # reconnecting per request. Opening a SQLite connection is cheap, so
+        # this saves little here; it pays off once ENGINE points at a
+        # networked database (e.g. PostgreSQL), where each new connection
+        # costs a handshake. Health checks discard connections that died
+        # while idle.
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Serialized authors are cached here (see AuthorSerializer). Set REDIS_URL to
+# share the cache across processes; otherwise a per-process memory cache is used.
+
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ['REDIS_URL'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -150,7 +179,7 @@ REST_FRAMEWORK = {
     
     # Default renderer classes
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.ORJSONRenderer',  # JSONRenderer, encoded by orjson when installed
         'rest_framework.renderers.BrowsableAPIRenderer',  # For web browsable API
     ],
     
@@ -167,6 +196,33 @@ REST_FRAMEWORK = {
     # Default metadata class
     'DEFAULT_METADATA_CLASS': 'rest_framework.metadata.SimpleMetadata',
     
-    # Exception handling
-    'EXCEPTION_HANDLER': 'rest_framework.views.exception_handler',
+    # Exception handling: DRF's handler, with the API's 'message'/'status'
+    # keys added (see api/exceptions.py)
+    'EXCEPTION_HANDLER': 'api.exceptions.api_exception_handler',
+}
+
+# Logging: the api app's INFO records (book create/update/delete) go to
+# stderr through a queue, written by a background thread instead of the
+# request thread
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'verbose': {
+            'format': '{asctime} {levelname} {name} {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'background_console': {
+            'class': 'advanced_api_project.log_handlers.BackgroundStreamHandler',
+            'formatter': 'verbose',
+        },
+    },
+    'loggers': {
+        'api': {
+            'handlers': ['background_console'],
+            'level': 'INFO',
+        },
+    },
 }
@@ -1,8 +1,90 @@
+from datetime import date
+
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils.functional import cached_property
 from .models import Author, Book
 
 # Register your models here.
 
+
+class AnnotatedChangeList(ChangeList):
+    """
+    ChangeList that applies `ModelAdmin.get_queryset_annotations()` to the
+    rows it displays and orders by.
+    
+    `ModelAdmin.get_queryset()` stays un-annotated, so the full result count,
+    the change form, bulk actions and autocomplete lookups don't pay for
+    display-only annotations.
+    """
+    
+    def get_queryset(self, request, exclude_parameters=None):
+        root_queryset = self.root_queryset
+        self.root_queryset = self.model_admin.get_queryset_annotations(root_queryset)
+        try:
+            return super().get_queryset(request, exclude_parameters)
+        finally:
+            self.root_queryset = root_queryset
+
+
+class LargeTablePaginator(Paginator):
+    """
+    Paginator that estimates the row count of unfiltered changelists.
+    
+    On PostgreSQL an unfiltered `SELECT COUNT(*)` scans the whole table, so
+    the planner's `pg_class.reltuples` estimate is used instead. Filtered or
+    searched querysets, other backends, and tables that have not been
+    analyzed yet fall back to the exact count.
+    """
+    
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where and connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [query.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] > 0:
+                return row[0]
+        return super().count
+
+
+class DecadeListFilter(admin.SimpleListFilter):
+    """
+    Filter books by publication decade.
+    
+    The choices are a fixed list of decades rather than the distinct
+    `publication_year` values, so rendering the sidebar doesn't run a
+    `SELECT DISTINCT ... ORDER BY` over the Book table.
+    """
+    title = 'publication decade'
+    parameter_name = 'decade'
+    
+    FIRST_DECADE = 1900
+    DECADES = range(FIRST_DECADE, date.today().year // 10 * 10 + 1, 10)
+    
+    def lookups(self, request, model_admin):
+        choices = [(str(decade), f'{decade}s') for decade in reversed(self.DECADES)]
+        choices.append(('earlier', f'Before {self.FIRST_DECADE}'))
+        return choices
+    
+    def queryset(self, request, queryset):
+        value = self.value()
+        if value == 'earlier':
+            return queryset.filter(publication_year__lt=self.FIRST_DECADE)
+        if value and value.isdigit():
+            start = int(value)
+            return queryset.filter(publication_year__gte=start, publication_year__lt=start + 10)
+        return queryset
+
+
 @admin.register(Author)
 class AuthorAdmin(admin.ModelAdmin):
     """
@@ -15,10 +97,34 @@ class AuthorAdmin(admin.ModelAdmin):
     search_fields = ['name']
     ordering = ['name']
     
+    def get_changelist(self, request, **kwargs):
+        return AnnotatedChangeList
+    
+    def get_queryset_annotations(self, queryset):
+        """
+        Annotate the book count so the changelist doesn't query per row.
+        
+        The count is computed in a correlated subquery rather than with
+        `Count('books')` so further aggregate annotations (e.g. latest
+        publication year) can be added without JOIN row multiplication.
+        """
+        book_count = (
+            Book.objects
+            .filter(author=OuterRef('pk'))
+            .order_by()
+            .values('author')
+            .annotate(c=Count('*'))
+            .values('c')
+        )
+        return queryset.annotate(
+            _book_count=Coalesce(Subquery(book_count, output_field=IntegerField()), Value(0))
+        )
+    
     def book_count(self, obj):
         """Display the number of books by this author."""
-        return obj.books.count()
+        return obj._book_count
     book_count.short_description = 'Number of Books'
+    book_count.admin_order_field = '_book_count'
 
 
 @admin.register(Book)
@@ -30,7 +136,10 @@ class BookAdmin(admin.ModelAdmin):
     filtering, search, and organized display options.
     """
     list_display = ['title', 'author', 'publication_year']
-    list_filter = ['publication_year', 'author']
+    list_filter = [DecadeListFilter]
     search_fields = ['title', 'author__name']
+    autocomplete_fields = ['author']  # Looks authors up via AuthorAdmin.search_fields
     ordering = ['-publication_year', 'title']
     list_select_related = ['author']  # Optimize database queries
+    show_full_result_count = False  # Skip the extra unfiltered COUNT(*)
+    paginator = LargeTablePaginator
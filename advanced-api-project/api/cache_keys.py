@@ -0,0 +1,7 @@
+# Cache keys shared by the views that fill the cache and the signal
+# receivers that invalidate it, kept apart so api.signals doesn't have to
+# import the views.
+
+# book_stats payload: an (etag, stats) pair; bump the key's version when
+# that shape changes
+BOOK_STATS_CACHE_KEY = 'book_stats:v2'
@@ -0,0 +1,34 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.views import exception_handler
+
+
+def api_exception_handler(exc, context):
+    """
+    Project-wide DRF exception handler using the API's error envelope.
+    
+    Validation failures in views that set `error_message` (the generic
+    create/update views) become `{'message': <error_message>, 'errors': ...,
+    'status': 'error'}`, so those views can simply call
+    `serializer.is_valid(raise_exception=True)`.
+    Validation failures elsewhere keep DRF's default body.
+    
+    Every other API error (401, 403, 404, 405, 429, ...) keeps DRF's
+    `{'detail': ...}` body, with `message` (the same text) and `status`
+    added alongside it.
+    """
+    response = exception_handler(exc, context)
+    if response is None:
+        return None
+    
+    if isinstance(exc, ValidationError):
+        error_message = getattr(context.get('view'), 'error_message', None)
+        if error_message:
+            response.data = {
+                'message': error_message,
+                'errors': response.data,
+                'status': 'error'
+            }
+    elif isinstance(response.data, dict):
+        response.data['message'] = response.data.get('detail')
+        response.data['status'] = 'error'
+    return response
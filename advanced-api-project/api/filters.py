@@ -0,0 +1,90 @@
+from django import forms
+from django.db.models import Q
+from django_filters import rest_framework as filters
+from django_filters.constants import EMPTY_VALUES
+
+from .models import Book
+
+
+class LenientIntegerField(forms.IntegerField):
+    """Integer form field that treats unparseable input as "not given"."""
+    
+    def to_python(self, value):
+        try:
+            return super().to_python(value)
+        except forms.ValidationError:
+            return None
+
+
+class LenientYearFilter(filters.NumberFilter):
+    """
+    Year filter that ignores malformed values instead of rejecting the request.
+    
+    Keeps the long-standing behaviour of the year range parameters, where
+    e.g. `?year_from=invalid` simply returns the unfiltered list.
+    """
+    field_class = LenientIntegerField
+
+
+class BookFilter(filters.FilterSet):
+    """
+    FilterSet for BookListView.
+    
+    Combines the standard field lookups with the custom query parameters the
+    API has always accepted, so every parameter is parsed once by
+    django-filter rather than by hand in the view.
+    
+    Query Parameters:
+        ?author=<id>, ?publication_year=<year> (also __gte/__lte),
+        ?title__icontains=<text> - standard field lookups
+        ?year_from=<year> - books published from this year onwards
+        ?year_to=<year> - books published up to this year
+        ?author_name=<text> - books by author name (case-insensitive partial match)
+    """
+    year_from = LenientYearFilter(field_name='publication_year', lookup_expr='gte')
+    year_to = LenientYearFilter(field_name='publication_year', lookup_expr='lte')
+    author_name = filters.CharFilter(field_name='author__name', lookup_expr='icontains')
+    
+    class Meta:
+        model = Book
+        fields = {
+            'author': ['exact'],  # Filter by exact author ID
+            'publication_year': ['exact', 'gte', 'lte'],  # Exact year, greater/less than
+            'title': ['icontains'],  # Case-insensitive partial match
+        }
+    
+    def filter_queryset(self, queryset):
+        """
+        Apply every plain lookup parameter in a single `.filter(Q(...))`.
+        
+        django-filter's default applies one `.filter()` per parameter, each
+        cloning the queryset; combining the plain forward lookups yields the
+        same SQL from a single clone. Any filter that does more than that
+        (see _is_plain_lookup) is still applied through its own filter().
+        """
+        conditions = Q()
+        for name, value in self.form.cleaned_data.items():
+            if value in EMPTY_VALUES:
+                continue
+            f = self.filters[name]
+            if _is_plain_lookup(f, value):
+                conditions &= Q(**{f'{f.field_name}__{f.lookup_expr}': value})
+            else:
+                queryset = f.filter(queryset, value)
+        return queryset.filter(conditions) if conditions else queryset
+
+
+# filter() implementations that amount to `qs.filter(<field>__<lookup>=value)`
+# for a non-empty value, given the checks in _is_plain_lookup
+_PLAIN_FILTER_METHODS = (filters.Filter.filter, filters.ChoiceFilter.filter)
+
+
+def _is_plain_lookup(f, value):
+    """Return whether filtering `value` with `f` is a single forward lookup."""
+    return (
+        type(f).filter in _PLAIN_FILTER_METHODS
+        and not f.method
+        and not f.exclude
+        and not f.distinct
+        and value != getattr(f, 'null_value', None)
+    )
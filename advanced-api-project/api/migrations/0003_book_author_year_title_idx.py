@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['author', '-publication_year', 'title'], name='book_author_year_title_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:49
+
+import api.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_author_updated_at_book_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(api.models.Decade('publication_year'), name='book_decade_idx'),
+        ),
+    ]
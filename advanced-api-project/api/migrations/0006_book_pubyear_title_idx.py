@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 02:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_book_decade_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['-publication_year', 'title'], name='book_pubyear_title_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations
+
+
+# Django's icontains lookup (DRF's SearchFilter on ?search=, the
+# title__icontains / author_name filters, and the admin changelist search)
+# compiles on PostgreSQL to `UPPER(col::text) LIKE UPPER('%term%')`, which a
+# btree or plain-column trigram index cannot serve; trigram indexes on that
+# exact expression can.
+UPPER_TRIGRAM_INDEXES = [
+    ('api_author_name_upper_trgm_idx', 'api_author', 'name'),
+    ('api_book_title_upper_trgm_idx', 'api_book', 'title'),
+]
+
+
+def create_upper_trigram_indexes(apps, schema_editor):
+    """Create pg_trgm GIN indexes backing icontains searches (PostgreSQL only)."""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for index_name, table, column in UPPER_TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} '
+            f'USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+def drop_upper_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _table, _column in UPPER_TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_author_name_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_upper_trigram_indexes, drop_upper_trigram_indexes),
+    ]
@@ -0,0 +1,38 @@
+from django.db import migrations
+
+
+# The plain-column gin_trgm_ops indexes created by 0002 for the admin's
+# similarity() search. The admin now uses Django's default icontains search,
+# served by the UPPER() trigram indexes of 0008, so no query uses these and
+# they only add write cost.
+PLAIN_TRIGRAM_INDEXES = [
+    ('api_author_name_trgm_idx', 'api_author', 'name'),
+    ('api_book_title_trgm_idx', 'api_book', 'title'),
+]
+
+
+def drop_plain_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _table, _column in PLAIN_TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+def recreate_plain_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, table, column in PLAIN_TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON {table} USING gin ({column} gin_trgm_ops)'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_upper_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_plain_trigram_indexes, recreate_plain_trigram_indexes),
+    ]
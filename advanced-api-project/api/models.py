@@ -2,6 +2,17 @@ from django.db import models
 
 # Create your models here.
 
+class Decade(models.Func):
+    """
+    Round an integer year down to its decade (1997 -> 1990).
+    
+    The constants are part of the SQL template rather than query parameters,
+    so the expression matches Book's book_decade_idx on backends (such as
+    SQLite) that only use an expression index for a literal match.
+    """
+    template = '((%(expressions)s / 10) * 10)'
+    output_field = models.IntegerField()
+
 class Author(models.Model):
     """
     Author model representing a book author.
@@ -12,8 +23,11 @@ class Author(models.Model):
     
     Fields:
         name (CharField): The full name of the author (max 100 characters)
+        updated_at (DateTimeField): Last change to the author or one of their
+            books; versions the cached AuthorSerializer output
     """
     name = models.CharField(max_length=100, help_text="The full name of the author")
+    updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
         """Return string representation of the author."""
@@ -23,6 +37,11 @@ class Author(models.Model):
         ordering = ['name']  # Order authors alphabetically by name
         verbose_name = "Author"
         verbose_name_plural = "Authors"
+        indexes = [
+            # Serves the default name ordering of author lists and the
+            # paginated reads that follow it, instead of sorting every author
+            models.Index(fields=['name'], name='author_name_idx'),
+        ]
 
 
 class Book(models.Model):
@@ -38,6 +57,7 @@ class Book(models.Model):
         title (CharField): The title of the book (max 200 characters)
         publication_year (IntegerField): The year the book was published
         author (ForeignKey): Reference to the Author who wrote this book
+        updated_at (DateTimeField): When the book was last modified
     
     Relationships:
         - Many-to-One with Author: Each book has one author, 
@@ -52,6 +72,13 @@ class Book(models.Model):
         related_name='books',
         help_text="The author who wrote this book"
     )
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __init__(self, *args, **kwargs):
+        """Remember the current author to detect reassignment on save."""
+        super().__init__(*args, **kwargs)
+        # Refreshed after each save by api.signals.touch_book_author
+        self._loaded_author_id = self.__dict__.get('author_id')
     
     def __str__(self):
         """Return string representation of the book."""
@@ -63,3 +90,14 @@ class Book(models.Model):
         verbose_name_plural = "Books"
         # Ensure no duplicate books (same title and author)
         unique_together = ['title', 'author']
+        indexes = [
+            # Serves per-author book lookups (e.g. prefetching an author's books)
+            # in the default ordering without a separate sort step
+            models.Index(fields=['author', '-publication_year', 'title'], name='book_author_year_title_idx'),
+            # Matches the default ordering, so unfiltered book list pages are
+            # read in index order instead of sorting the whole table
+            models.Index(fields=['-publication_year', 'title'], name='book_pubyear_title_idx'),
+            # Lets the per-decade GROUP BY in book_stats read the index
+            # instead of computing the decade for every row
+            models.Index(Decade('publication_year'), name='book_decade_idx'),
+        ]
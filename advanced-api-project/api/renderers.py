@@ -0,0 +1,37 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that encodes with orjson when it is installed.
+    
+    Falls back to DRF's JSONRenderer when orjson is missing or an indented
+    response is requested (e.g. `Accept: application/json; indent=4`).
+    Otherwise the compact UTF-8 output matches JSONRenderer's for the data
+    serializers produce: U+2028/U+2029 are escaped the same way, and UTC
+    datetimes end in `Z`. Types orjson doesn't know natively (Decimal, lazy
+    strings, ...) are handed to DRF's JSONEncoder.
+    
+    Known differences: NaN and infinite floats render as `null` where
+    JSONRenderer raises, and integers beyond 64 bits raise where
+    JSONRenderer encodes them.
+    """
+    _default = JSONEncoder().default
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        ret = orjson.dumps(
+            data, default=self._default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        )
+        # Escape the JavaScript line terminators like JSONRenderer does, so
+        # the output stays valid when embedded in a <script> block
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -1,6 +1,37 @@
+from django.core.cache import cache
 from rest_framework import serializers
 from .models import Author, Book
 from datetime import datetime
+import re
+import time
+
+# Books nested in each serialized author: the newest ones, up to this many.
+# An author's full list is paginated by api.views.AuthorBooksView.
+AUTHOR_RECENT_BOOKS_LIMIT = 20
+
+# Matches any Unicode letter (word characters minus digits and underscore)
+_HAS_LETTER_RE = re.compile(r'[^\W\d_]')
+
+
+def _start_of_next_year(year):
+    """Return the POSIX timestamp of local midnight on 1 January after `year`."""
+    return datetime(year + 1, 1, 1).timestamp()
+
+
+# The current year is cached until the next 1 January instead of being read
+# from the clock on every validated publication_year.
+_current_year = datetime.now().year
+_current_year_ends_at = _start_of_next_year(_current_year)
+
+
+def get_current_year():
+    """Return the current year, refreshing the cached value once the year has ended."""
+    global _current_year, _current_year_ends_at
+    if time.time() >= _current_year_ends_at:
+        _current_year = datetime.now().year
+        _current_year_ends_at = _start_of_next_year(_current_year)
+    return _current_year
+
 
 class BookSerializer(serializers.ModelSerializer):
     """
@@ -20,6 +51,12 @@ class BookSerializer(serializers.ModelSerializer):
         - publication_year: Must not be in the future
     """
     
+    # Columns read views load (see SerializerOnlyFieldsMixin). author__name
+    # keeps an author joined by select_related('author') (e.g. for
+    # ?ordering=author__name) down to id and name; without the join it is
+    # ignored.
+    serializer_only_fields = ('id', 'title', 'publication_year', 'author_id', 'author__name')
+    
     class Meta:
         model = Book
         fields = ['id', 'title', 'publication_year', 'author']
@@ -40,7 +77,7 @@ class BookSerializer(serializers.ModelSerializer):
         Raises:
             serializers.ValidationError: If the publication year is in the future
         """
-        current_year = datetime.now().year
+        current_year = get_current_year()
         
         if value > current_year:
             raise serializers.ValidationError(
@@ -57,6 +94,22 @@ class BookSerializer(serializers.ModelSerializer):
         return value
 
 
+class BookBulkUpdateSerializer(BookSerializer):
+    """
+    Validates the field values applied to many books at once.
+    
+    Every field is optional, and the (title, author) uniqueness check is left
+    to the database, since it depends on which books the values land on.
+    """
+    
+    class Meta(BookSerializer.Meta):
+        validators = []
+        extra_kwargs = {
+            'title': {'required': False},
+            'author': {'required': False},
+        }
+
+
 class AuthorSerializer(serializers.ModelSerializer):
     """
     Custom serializer for the Author model with nested book serialization.
@@ -70,13 +123,14 @@ class AuthorSerializer(serializers.ModelSerializer):
     Serialized Fields:
         - id: Auto-generated primary key
         - name: Author's full name
-        - books: Nested serialization of all books by this author
+        - books: Nested serialization of the author's most recent books
     
     Relationship Handling:
-        The 'books' field uses the related_name='books' defined in the 
-        Book model's foreign key to Author. This allows the serializer
-        to automatically access all books written by the author through
-        the reverse relationship.
+        The 'books' field renders the author's newest books (up to
+        AUTHOR_RECENT_BOOKS_LIMIT), so authors with many books stay bounded.
+        It uses the `recent_books` list attached by the views'
+        AUTHOR_BOOKS_PREFETCH and queries them itself when that is missing.
+        The complete list is served by GET /api/authors/<id>/books/.
     
     Usage:
         When serializing an Author instance, the output will include:
@@ -100,15 +154,49 @@ class AuthorSerializer(serializers.ModelSerializer):
         }
     """
     
-    # Nested serialization of related books
-    # many=True because one author can have many books
-    # read_only=True because we don't want to allow creation/editing of books through author serializer
-    books = BookSerializer(many=True, read_only=True)
+    # Nested serialization of the author's most recent books (see get_books);
+    # read-only, so books can't be created or edited through this serializer
+    books = serializers.SerializerMethodField()
+    
+    # Seconds a serialized author stays cached; entries are keyed on
+    # updated_at, so edits to the author or their books never serve stale data
+    cache_timeout = 3600
     
     class Meta:
         model = Author
         fields = ['id', 'name', 'books']
     
+    def to_representation(self, instance):
+        """
+        Return the cached representation for this version of the author.
+        
+        The cache key includes `updated_at`, which is bumped whenever the
+        author or one of their books is saved or deleted (see api/signals.py).
+        """
+        updated_at = getattr(instance, 'updated_at', None)
+        if instance.pk is None or updated_at is None:
+            return super().to_representation(instance)
+        
+        key = f"author:{instance.pk}:recent:v{updated_at.timestamp()}"
+        return cache.get_or_set(
+            key,
+            lambda: super(AuthorSerializer, self).to_representation(instance),
+            self.cache_timeout,
+        )
+    
+    def get_books(self, obj):
+        """
+        Return the author's most recent books, newest first.
+        
+        Uses the `recent_books` list when the queryset prefetched it (see
+        api.views.AUTHOR_BOOKS_PREFETCH), and only runs a query per author
+        otherwise.
+        """
+        books = getattr(obj, 'recent_books', None)
+        if books is None:
+            books = obj.books.order_by('-publication_year', 'title')[:AUTHOR_RECENT_BOOKS_LIMIT]
+        return BookSerializer(books, many=True, context=self.context).data
+    
     def validate_name(self, value):
         """
         Custom validation for the author name field.
@@ -138,7 +226,7 @@ class AuthorSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Author name must be at least 2 characters long.")
         
         # Check that name contains at least one letter
-        if not any(char.isalpha() for char in cleaned_name):
+        if not _HAS_LETTER_RE.search(cleaned_name):
             raise serializers.ValidationError("Author name must contain at least one letter.")
         
         return cleaned_name
@@ -160,6 +248,11 @@ class SimpleBookSerializer(serializers.ModelSerializer):
     """
     author_name = serializers.CharField(source='author.name', read_only=True)
     
+    # Columns this serializer reads; views using it load only these
+    # (see SerializerOnlyFieldsMixin). author__name also needs
+    # select_related('author') on the view.
+    serializer_only_fields = ('id', 'title', 'publication_year', 'author_id', 'author__name')
+    
     class Meta:
         model = Book
         fields = ['id', 'title', 'publication_year', 'author', 'author_name']
@@ -183,5 +276,17 @@ class SimpleAuthorSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'book_count']
     
     def get_book_count(self, obj):
-        """Return the number of books written by this author."""
+        """
+        Return the number of books written by this author.
+        
+        Uses the `_book_count` annotation when the queryset provides it
+        (e.g. `Author.objects.annotate(_book_count=Count('books'))`), then
+        the prefetched `books` list if present, and only falls back to a
+        COUNT query per author otherwise.
+        """
+        book_count = getattr(obj, '_book_count', None)
+        if book_count is not None:
+            return book_count
+        if 'books' in getattr(obj, '_prefetched_objects_cache', {}):
+            return len(obj.books.all())
         return obj.books.count()
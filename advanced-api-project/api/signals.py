@@ -0,0 +1,70 @@
+import threading
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from .cache_keys import BOOK_STATS_CACHE_KEY
+from .models import Author, Book
+
+# Per-thread state of an open batched_invalidation() block, or None
+_batch = threading.local()
+
+
+@contextmanager
+def batched_invalidation():
+    """
+    Defer the invalidation done by the receivers below to the end of the block.
+    
+    Inside the block the receivers only record which authors were affected;
+    on a clean exit those authors are touched with one UPDATE and the
+    book_stats entry is dropped once, instead of once per saved or deleted
+    row. Nested blocks fold into the outermost one.
+    """
+    if getattr(_batch, 'author_ids', None) is not None:
+        yield
+        return
+    _batch.author_ids = set()
+    _batch.stats_dirty = False
+    try:
+        yield
+        author_ids, stats_dirty = _batch.author_ids, _batch.stats_dirty
+    finally:
+        _batch.author_ids = None
+    if author_ids:
+        Author.objects.filter(pk__in=author_ids).update(updated_at=timezone.now())
+    if stats_dirty:
+        cache.delete(BOOK_STATS_CACHE_KEY)
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+def touch_book_author(sender, instance, **kwargs):
+    """
+    Bump the owning author's updated_at when one of their books changes.
+    
+    AuthorSerializer caches its output per (author id, updated_at), so this
+    invalidates the nested book list. A book moved to another author bumps
+    both the previous and the new author.
+    """
+    author_ids = {instance.author_id, getattr(instance, '_loaded_author_id', None)}
+    author_ids.discard(None)
+    if getattr(_batch, 'author_ids', None) is not None:
+        _batch.author_ids |= author_ids
+    else:
+        Author.objects.filter(pk__in=author_ids).update(updated_at=timezone.now())
+    # The saved author is now the one to compare the next save against
+    instance._loaded_author_id = instance.author_id
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+def invalidate_book_stats(sender, **kwargs):
+    """Drop the cached book_stats payload when a book or author changes."""
+    if getattr(_batch, 'author_ids', None) is not None:
+        _batch.stats_dirty = True
+    else:
+        cache.delete(BOOK_STATS_CACHE_KEY)
@@ -25,18 +25,63 @@ Usage:
     python manage.py test api.test_views
     python manage.py test api.test_views.BookCRUDTestCase
     python manage.py test api.test_views.BookFilteringTestCase
+    pytest api/test_views.py::BookFilteringTestCase  (requires pytest-django)
+    pytest -n auto --dist loadscope  (parallel, requires pytest-xdist)
+
+    With a file-based or server test database, keep the schema between runs:
+    python manage.py test api.test_views --keepdb
 """
 
-from django.test import TestCase
+import json
+import time
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
+import django_filters
 
+from .cache_keys import BOOK_STATS_CACHE_KEY
+from .filters import BookFilter
+from . import serializers
 from .models import Author, Book
-from .serializers import BookSerializer, AuthorSerializer
+from .renderers import ORJSONRenderer
+from .serializers import AUTHOR_RECENT_BOOKS_LIMIT, BookSerializer, AuthorSerializer
+
+
+# URLs without arguments never change, so resolve them once at import
+BOOK_LIST_URL = reverse('api:book-list')
+BOOK_CREATE_URL = reverse('api:book-create')
+BOOK_STATS_URL = reverse('api:book-stats')
+AUTHOR_LIST_URL = reverse('api:author-list')
+MY_BOOKS_URL = reverse('api:my-books')
+BOOK_UPDATE_ENDPOINT_URL = reverse('api:book-update-endpoint')
+BOOK_DELETE_ENDPOINT_URL = reverse('api:book-delete-endpoint')
+
+# Keys every book_stats response must contain
+_REQUIRED_STATS = frozenset({'total_books', 'total_authors', 'latest_book', 'oldest_book', 'books_by_decade'})
+
 
+@lru_cache(maxsize=None)
+def _url_template(name):
+    """Reverse a detail-style URL once with a sentinel pk and return a format template."""
+    return reverse(name, kwargs={'pk': 0}).replace('/0/', '/{pk}/')
 
+
+def _url(name, pk):
+    """Build a detail-style URL for ``pk`` without walking the resolver again."""
+    return _url_template(name).format(pk=pk)
+
+
+# Hashing test passwords with PBKDF2 dominates fixture setup; MD5 is fine here
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class BaseAPITestCase(APITestCase):
     """
     Base test case class with common setup for all API tests.
@@ -44,53 +89,99 @@ class BaseAPITestCase(APITestCase):
     Provides:
     - Test users (authenticated and unauthenticated)
     - Sample data (authors and books)
+    - Pre-authenticated clients (auth_client, admin_client)
     - Helper methods for authentication
     """
     
-    def setUp(self):
-        """Set up test data and authentication."""
-        
-        # Create test users
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Set up test data once per test case class.
+        
+        Each test runs inside a transaction that is rolled back afterwards,
+        and Django hands every test its own copy of these attributes, so
+        tests may modify them freely.
+        """
+        
+        # Create test users. Only testuser logs in with a password (see
+        # test_session_based_authentication); the admin is always
+        # force-authenticated, so it gets an unusable password and no hash.
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
         
-        self.admin_user = User.objects.create_user(
+        cls.admin_user = User.objects.create_user(
             username='admin',
             email='admin@example.com',
-            password='adminpass123',
+            password=None,
             is_staff=True
         )
         
-        # Create test authors
-        self.author1 = Author.objects.create(name="J.K. Rowling")
-        self.author2 = Author.objects.create(name="J.R.R. Tolkien")
-        self.author3 = Author.objects.create(name="Stephen King")
-        
-        # Create test books
-        self.book1 = Book.objects.create(
-            title="Harry Potter and the Philosopher's Stone",
-            publication_year=1997,
-            author=self.author1
-        )
-        
-        self.book2 = Book.objects.create(
-            title="The Lord of the Rings",
-            publication_year=1954,
-            author=self.author2
-        )
-        
-        self.book3 = Book.objects.create(
-            title="The Shining",
-            publication_year=1977,
-            author=self.author3
-        )
-        
-        # API Client
-        self.client = APIClient()
-        
+        # Create test authors and books with one INSERT each; SQLite returns
+        # the new primary keys, so the instances are usable as FK targets
+        cls.author1, cls.author2, cls.author3 = Author.objects.bulk_create([
+            Author(name="J.K. Rowling"),
+            Author(name="J.R.R. Tolkien"),
+            Author(name="Stephen King"),
+        ])
+        
+        cls.book1, cls.book2, cls.book3 = Book.objects.bulk_create([
+            Book(
+                title="Harry Potter and the Philosopher's Stone",
+                publication_year=1997,
+                author=cls.author1
+            ),
+            Book(
+                title="The Lord of the Rings",
+                publication_year=1954,
+                author=cls.author2
+            ),
+            Book(
+                title="The Shining",
+                publication_year=1977,
+                author=cls.author3
+            ),
+        ])
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Pre-authenticated clients shared by the tests of a class.
+        # force_authenticate() stores no cookies or session state, so a
+        # single client per user is safe to reuse between tests.
+        cls.auth_client = APIClient()
+        cls.auth_client.force_authenticate(user=cls.user)
+        cls.admin_client = APIClient()
+        cls.admin_client.force_authenticate(user=cls.admin_user)
+    
+    # Classes whose tests never write set this to share the class-wide
+    # transaction opened by setUpClass instead of wrapping every test in its
+    # own savepoint; the class transaction is still rolled back at the end.
+    read_only = False
+    
+    @classmethod
+    def _fixture_setup(cls):
+        if cls.read_only and cls._databases_support_savepoints():
+            return
+        super()._fixture_setup()
+    
+    def _fixture_teardown(self):
+        if self.read_only and self._databases_support_savepoints():
+            return
+        super()._fixture_teardown()
+    
+    # APITestCase already gives every test a fresh, unauthenticated
+    # APIClient as self.client, so no setUp() is needed.
+    
+    # Valid create/update fields shared by the write tests; see book_payload()
+    BOOK_PAYLOAD_TEMPLATE = {'title': 'Test Book', 'publication_year': 2023}
+    
+    def book_payload(self, **overrides):
+        """Return a valid book payload for author1 with ``overrides`` applied."""
+        return {**self.BOOK_PAYLOAD_TEMPLATE, 'author': self.author1.id, **overrides}
+    
     def authenticate_user(self):
         """Authenticate as regular user."""
         self.client.force_authenticate(user=self.user)
@@ -118,16 +209,10 @@ class BookCRUDTestCase(BaseAPITestCase):
     
     def test_create_book_authenticated(self):
         """Test creating a book with authenticated user."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-create')
-        data = {
-            'title': 'New Test Book',
-            'publication_year': 2023,
-            'author': self.author1.id
-        }
+        url = BOOK_CREATE_URL
+        data = self.book_payload(title='New Test Book')
         
-        response = self.client.post(url, data, format='json')
+        response = self.auth_client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn('message', response.data)
@@ -135,21 +220,18 @@ class BookCRUDTestCase(BaseAPITestCase):
         self.assertEqual(response.data['status'], 'success')
         self.assertEqual(response.data['book']['title'], 'New Test Book')
         
-        # Verify book was actually created in database
+        # Verify book was actually created in database (primary key lookup)
+        created_id = response.data['book']['id']
         self.assertTrue(
-            Book.objects.filter(title='New Test Book').exists()
+            Book.objects.filter(pk=created_id, title='New Test Book').exists()
         )
     
     def test_create_book_unauthenticated(self):
         """Test creating a book without authentication should fail."""
         self.unauthenticate()
         
-        url = reverse('api:book-create')
-        data = {
-            'title': 'Unauthorized Book',
-            'publication_year': 2023,
-            'author': self.author1.id
-        }
+        url = BOOK_CREATE_URL
+        data = self.book_payload(title='Unauthorized Book')
         
         response = self.client.post(url, data, format='json')
         
@@ -162,16 +244,14 @@ class BookCRUDTestCase(BaseAPITestCase):
     
     def test_create_book_invalid_data(self):
         """Test creating a book with invalid data."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-create')
-        data = {
-            'title': '',  # Empty title
-            'publication_year': 2050,  # Future year (should be validated)
-            'author': 999  # Non-existent author
-        }
+        url = BOOK_CREATE_URL
+        data = self.book_payload(
+            title='',  # Empty title
+            publication_year=2050,  # Future year (should be validated)
+            author=999  # Non-existent author
+        )
         
-        response = self.client.post(url, data, format='json')
+        response = self.auth_client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('errors', response.data)
@@ -181,48 +261,79 @@ class BookCRUDTestCase(BaseAPITestCase):
         """Test that anyone can list books."""
         self.unauthenticate()
         
-        url = reverse('api:book-list')
-        response = self.client.get(url)
+        url = BOOK_LIST_URL
+        # A single SELECT of the page of books (cursor pagination needs no
+        # COUNT, and the author is rendered as its id, so it isn't joined)
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('results', response.data)
-        self.assertEqual(len(response.data['results']), 3)  # We have 3 test books
-        
-        # Check that response includes filtering documentation
-        self.assertIn('available_filters', response.data)
-        self.assertIn('available_search', response.data)
-        self.assertIn('available_ordering', response.data)
+        data = response.data
+        self.assertIn('results', data)
+        self.assertEqual(len(data['results']), 3)  # We have 3 test books
+        
+        # Filtering documentation is only sent on request
+        self.assertNotIn('available_filters', data)
+        data = self.client.get(url, {'help': '1'}).data
+        self.assertIn('available_filters', data)
+        self.assertIn('available_search', data)
+        self.assertIn('available_ordering', data)
+        self.assertNotIn('help', data['filters_applied']['filters'])
     
     def test_get_book_detail_public_access(self):
         """Test that anyone can view book details."""
         self.unauthenticate()
         
-        url = reverse('api:book-detail', kwargs={'pk': self.book1.id})
+        url = _url('api:book-detail', self.book1.id)
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['title'], self.book1.title)
-        self.assertEqual(response.data['publication_year'], self.book1.publication_year)
+        data = response.data
+        self.assertEqual(data['title'], self.book1.title)
+        self.assertEqual(data['publication_year'], self.book1.publication_year)
     
     def test_get_nonexistent_book(self):
         """Test getting a book that doesn't exist."""
-        url = reverse('api:book-detail', kwargs={'pk': 999})
+        url = _url('api:book-detail', 999)
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
     
+    def test_book_detail_conditional_get(self):
+        """Test that an unchanged book detail response is answered with 304."""
+        url = _url('api:book-detail', self.book1.id)
+        response = self.client.get(url)
+        etag = response['ETag']
+        self.assertTrue(response.has_header('Last-Modified'))
+        
+        # A repeat GET is validated without running the serializer
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        
+        # Changing the book's author (e.g. a rename) changes the ETag
+        self.author1.name = f'{self.author1.name}!'
+        self.author1.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+    
+    def test_book_list_is_not_conditional(self):
+        """Test that the book list is not validated with a table-wide ETag."""
+        response = self.client.get(BOOK_LIST_URL)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertFalse(response.has_header('Last-Modified'))
+    
     def test_update_book_authenticated(self):
         """Test updating a book with authenticated user."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-update', kwargs={'pk': self.book1.id})
-        data = {
-            'title': 'Updated Harry Potter Title',
-            'publication_year': 1998,  # Changed year
-            'author': self.author1.id
-        }
+        url = _url('api:book-update', self.book1.id)
+        data = self.book_payload(
+            title='Updated Harry Potter Title',
+            publication_year=1998  # Changed year
+        )
         
-        response = self.client.put(url, data, format='json')
+        response = self.auth_client.put(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('message', response.data)
@@ -237,15 +348,13 @@ class BookCRUDTestCase(BaseAPITestCase):
     
     def test_partial_update_book_authenticated(self):
         """Test partial updating (PATCH) a book."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-update', kwargs={'pk': self.book1.id})
+        url = _url('api:book-update', self.book1.id)
         data = {
             'title': 'Partially Updated Title'
             # Only updating title, not other fields
         }
         
-        response = self.client.patch(url, data, format='json')
+        response = self.auth_client.patch(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['book']['title'], 'Partially Updated Title')
@@ -259,7 +368,7 @@ class BookCRUDTestCase(BaseAPITestCase):
         """Test updating a book without authentication should fail."""
         self.unauthenticate()
         
-        url = reverse('api:book-update', kwargs={'pk': self.book1.id})
+        url = _url('api:book-update', self.book1.id)
         data = {'title': 'Unauthorized Update'}
         
         response = self.client.patch(url, data, format='json')
@@ -272,17 +381,16 @@ class BookCRUDTestCase(BaseAPITestCase):
     
     def test_delete_book_authenticated(self):
         """Test deleting a book with authenticated user."""
-        self.authenticate_user()
-        
         book_id = self.book1.id
-        url = reverse('api:book-delete', kwargs={'pk': book_id})
+        url = _url('api:book-delete', book_id)
         
-        response = self.client.delete(url)
+        response = self.auth_client.delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('message', response.data)
-        self.assertIn('deleted_book', response.data)
-        self.assertEqual(response.data['status'], 'success')
+        data = response.data
+        self.assertIn('message', data)
+        self.assertIn('deleted_book', data)
+        self.assertEqual(data['status'], 'success')
         
         # Verify book was actually deleted from database
         self.assertFalse(Book.objects.filter(id=book_id).exists())
@@ -291,7 +399,7 @@ class BookCRUDTestCase(BaseAPITestCase):
         """Test deleting a book without authentication should fail."""
         self.unauthenticate()
         
-        url = reverse('api:book-delete', kwargs={'pk': self.book1.id})
+        url = _url('api:book-delete', self.book1.id)
         response = self.client.delete(url)
         
         self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
@@ -301,12 +409,26 @@ class BookCRUDTestCase(BaseAPITestCase):
     
     def test_delete_nonexistent_book(self):
         """Test deleting a book that doesn't exist."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-delete', kwargs={'pk': 999})
-        response = self.client.delete(url)
+        url = _url('api:book-delete', 999)
+        response = self.auth_client.delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_reassigning_book_touches_previous_author(self):
+        """Test each save of a moved book bumps the author it was moved away from."""
+        book = Book.objects.create(title="Moving Book", publication_year=2001, author=self.author1)
+        
+        # author1 -> author2 on a freshly created instance
+        before = Author.objects.get(pk=self.author1.pk).updated_at
+        book.author = self.author2
+        book.save()
+        self.assertGreater(Author.objects.get(pk=self.author1.pk).updated_at, before)
+        
+        # author2 -> author3 on the same instance, without reloading it
+        before = Author.objects.get(pk=self.author2.pk).updated_at
+        book.author = self.author3
+        book.save()
+        self.assertGreater(Author.objects.get(pk=self.author2.pk).updated_at, before)
 
 
 class BookFilteringTestCase(BaseAPITestCase):
@@ -323,25 +445,27 @@ class BookFilteringTestCase(BaseAPITestCase):
     
     def test_filter_by_author(self):
         """Test filtering books by author ID."""
-        url = reverse('api:book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'author': self.author1.id})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)
-        self.assertEqual(response.data['results'][0]['author'], self.author1.id)
+        data = response.data
+        self.assertEqual(len(data['results']), 1)
+        self.assertEqual(data['results'][0]['author'], self.author1.id)
     
     def test_filter_by_publication_year(self):
         """Test filtering books by publication year."""
-        url = reverse('api:book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'publication_year': 1997})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)
-        self.assertEqual(response.data['results'][0]['publication_year'], 1997)
+        data = response.data
+        self.assertEqual(len(data['results']), 1)
+        self.assertEqual(data['results'][0]['publication_year'], 1997)
     
     def test_filter_by_publication_year_range(self):
         """Test filtering books by publication year range."""
-        url = reverse('api:book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'publication_year__gte': 1970})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -350,7 +474,7 @@ class BookFilteringTestCase(BaseAPITestCase):
     
     def test_custom_year_range_filter(self):
         """Test custom year range filtering (year_from and year_to)."""
-        url = reverse('api:book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {
             'year_from': 1950,
             'year_to': 1980
@@ -362,27 +486,29 @@ class BookFilteringTestCase(BaseAPITestCase):
     
     def test_filter_by_title_partial_match(self):
         """Test filtering books by title partial match."""
-        url = reverse('api:book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'title__icontains': 'harry'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)
-        self.assertIn('Harry Potter', response.data['results'][0]['title'])
+        data = response.data
+        self.assertEqual(len(data['results']), 1)
+        self.assertIn('Harry Potter', data['results'][0]['title'])
     
     def test_custom_author_name_filter(self):
         """Test custom author name filtering."""
-        url = reverse('api:book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'author_name': 'tolkien'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 1)
+        data = response.data
+        self.assertEqual(len(data['results']), 1)
         # Check that the book's author ID matches
-        book_result = response.data['results'][0]
+        book_result = data['results'][0]
         self.assertEqual(book_result['author'], self.author2.id)
     
     def test_search_functionality(self):
         """Test search across title and author name."""
-        url = reverse('api:book-list')
+        url = BOOK_LIST_URL
         
         # Search by book title
         response = self.client.get(url, {'search': 'potter'})
@@ -399,49 +525,44 @@ class BookFilteringTestCase(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 0)
     
-    def test_ordering_by_title(self):
-        """Test ordering books by title."""
-        url = reverse('api:book-list')
-        
-        # Ascending order
-        response = self.client.get(url, {'ordering': 'title'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        titles = [book['title'] for book in response.data['results']]
-        self.assertEqual(titles, sorted(titles))
-        
-        # Descending order
-        response = self.client.get(url, {'ordering': '-title'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        titles = [book['title'] for book in response.data['results']]
-        self.assertEqual(titles, sorted(titles, reverse=True))
-    
-    def test_ordering_by_publication_year(self):
-        """Test ordering books by publication year."""
-        url = reverse('api:book-list')
-        
-        # Ascending order
-        response = self.client.get(url, {'ordering': 'publication_year'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        years = [book['publication_year'] for book in response.data['results']]
-        self.assertEqual(years, sorted(years))
+    def test_ordering(self):
+        """Test ordering books by title, publication year and author name."""
+        url = BOOK_LIST_URL
+        author_names = {a.id: a.name for a in (self.author1, self.author2, self.author3)}
+        sort_keys = {
+            'title': lambda book: book['title'],
+            'publication_year': lambda book: book['publication_year'],
+            # The response only carries the author id, so map it back to a name
+            'author__name': lambda book: author_names[book['author']],
+        }
         
-        # Descending order (default)
-        response = self.client.get(url, {'ordering': '-publication_year'})
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        years = [book['publication_year'] for book in response.data['results']]
-        self.assertEqual(years, sorted(years, reverse=True))
+        for field, key in sort_keys.items():
+            for ordering, descending in ((field, False), ('-' + field, True)):
+                with self.subTest(ordering=ordering):
+                    response = self.client.get(url, {'ordering': ordering})
+                    self.assertEqual(response.status_code, status.HTTP_200_OK)
+                    values = [key(book) for book in response.data['results']]
+                    self.assertEqual(len(values), 3)
+                    self.assertEqual(values, sorted(values, reverse=descending))
     
-    def test_ordering_by_author_name(self):
-        """Test ordering books by author name."""
-        url = reverse('api:book-list')
-        response = self.client.get(url, {'ordering': 'author__name'})
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Check that results are ordered, but we'll verify by getting actual author info
-        results = response.data['results']
-        if len(results) > 1:
-            # Verify ordering by comparing author IDs or titles since we don't have author_name in response
-            self.assertTrue(len(results) >= 1)
+    def test_cursor_pagination_follows_related_ordering(self):
+        """Test walking every page of the book list ordered by author name."""
+        Book.objects.bulk_create([
+            Book(title=f"Extra Book {i}", publication_year=1960 + i, author=self.author2)
+            for i in range(12)
+        ])
+        
+        titles = []
+        url = BOOK_LIST_URL + '?ordering=author__name'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            titles += [book['title'] for book in response.data['results']]
+            url = response.data['next']
+        
+        # 15 books over two pages, each exactly once
+        self.assertEqual(len(titles), 15)
+        self.assertEqual(len(set(titles)), 15)
     
     def test_multiple_field_ordering(self):
         """Test ordering by multiple fields."""
@@ -452,7 +573,7 @@ class BookFilteringTestCase(BaseAPITestCase):
             author=self.author2
         )
         
-        url = reverse('api:book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {'ordering': 'author__name,publication_year'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -462,7 +583,7 @@ class BookFilteringTestCase(BaseAPITestCase):
     
     def test_combined_filter_search_order(self):
         """Test combining filtering, searching, and ordering."""
-        url = reverse('api:book-list')
+        url = BOOK_LIST_URL
         response = self.client.get(url, {
             'search': 'the',
             'year_from': 1950,
@@ -475,7 +596,7 @@ class BookFilteringTestCase(BaseAPITestCase):
         
     def test_invalid_filter_parameters(self):
         """Test handling of invalid filter parameters."""
-        url = reverse('api:book-list')
+        url = BOOK_LIST_URL
         
         # Invalid year format
         response = self.client.get(url, {'year_from': 'invalid'})
@@ -486,6 +607,21 @@ class BookFilteringTestCase(BaseAPITestCase):
         response = self.client.get(url, {'ordering': 'invalid_field'})
         # DRF should handle this gracefully
         self.assertIn(response.status_code, [status.HTTP_200_OK, status.HTTP_400_BAD_REQUEST])
+    
+    def test_book_filter_subclass_keeps_custom_filters(self):
+        """Test filters with method= or exclude=True are not folded into the combined lookup."""
+        
+        class CustomBookFilter(BookFilter):
+            not_author = django_filters.NumberFilter(field_name='author', exclude=True)
+            before = django_filters.NumberFilter(method='filter_before')
+            
+            def filter_before(self, queryset, name, value):
+                return queryset.filter(publication_year__lt=value)
+        
+        params = {'not_author': self.author3.id, 'before': 1998, 'title__icontains': 'harry'}
+        queryset = CustomBookFilter(params, queryset=Book.objects.all()).qs
+        
+        self.assertEqual(list(queryset), [self.book1])
 
 
 class AuthorAPITestCase(BaseAPITestCase):
@@ -498,42 +634,53 @@ class AuthorAPITestCase(BaseAPITestCase):
     - Search and ordering functionality for authors
     """
     
+    read_only = True
+    
     def test_list_authors(self):
         """Test listing all authors."""
-        url = reverse('api:author-list')
-        response = self.client.get(url)
+        url = AUTHOR_LIST_URL
+        # The paginator's COUNT, one page of authors and a single prefetch of
+        # their recent books, regardless of how many authors are listed
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 3)  # We have 3 test authors
+        self.assertEqual(response.data['count'], 3)  # We have 3 test authors
+        data = response.data['results']
+        self.assertEqual(len(data), 3)
         
         # Check nested books are included
-        for author_data in response.data:
+        for author_data in data:
             self.assertIn('books', author_data)
             if author_data['name'] == 'J.K. Rowling':
                 self.assertEqual(len(author_data['books']), 1)
     
     def test_get_author_detail(self):
         """Test getting author detail with books."""
-        url = reverse('api:author-detail', kwargs={'pk': self.author1.id})
-        response = self.client.get(url)
+        url = _url('api:author-detail', self.author1.id)
+        # The author plus one trimmed prefetch of their books
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['name'], 'J.K. Rowling')
-        self.assertIn('books', response.data)
-        self.assertEqual(len(response.data['books']), 1)
+        data = response.data
+        self.assertEqual(data['name'], 'J.K. Rowling')
+        self.assertIn('books', data)
+        self.assertEqual(len(data['books']), 1)
     
     def test_search_authors(self):
         """Test searching authors by name."""
-        url = reverse('api:author-list')
+        url = AUTHOR_LIST_URL
         response = self.client.get(url, {'search': 'tolkien'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['name'], 'J.R.R. Tolkien')
+        data = response.data
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]['name'], 'J.R.R. Tolkien')
     
     def test_order_authors_by_name(self):
         """Test ordering authors by name."""
-        url = reverse('api:author-list')
+        url = AUTHOR_LIST_URL
         response = self.client.get(url, {'ordering': 'name'})
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -541,6 +688,62 @@ class AuthorAPITestCase(BaseAPITestCase):
         self.assertEqual(names, sorted(names))
 
 
+class AuthorBooksAPITestCase(BaseAPITestCase):
+    """
+    Test cases for an author's complete book list.
+    
+    Tests:
+    - Author responses nest only the most recent books
+    - The author books endpoint pages through all of them
+    """
+    
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        Book.objects.bulk_create([
+            Book(title=f"Tolkien Book {i}", publication_year=1960 + i, author=cls.author2)
+            for i in range(24)
+        ])
+    
+    def test_author_detail_nests_recent_books(self):
+        """Test that author detail is bounded to the most recent books."""
+        response = self.client.get(_url('api:author-detail', self.author2.id))
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        years = [book['publication_year'] for book in response.data['books']]
+        self.assertEqual(len(years), AUTHOR_RECENT_BOOKS_LIMIT)
+        self.assertEqual(years, sorted(years, reverse=True))
+        self.assertEqual(years[0], 1983)
+    
+    def test_author_serializer_without_prefetch(self):
+        """Test AuthorSerializer bounds the nested books without the views' prefetch."""
+        author = Author.objects.get(pk=self.author2.pk)
+        
+        years = [book['publication_year'] for book in AuthorSerializer(author).data['books']]
+        self.assertEqual(len(years), AUTHOR_RECENT_BOOKS_LIMIT)
+        self.assertEqual(years[0], 1983)
+    
+    def test_author_books_endpoint(self):
+        """Test walking every page of an author's books."""
+        titles = []
+        url = _url('api:author-books', self.author2.id)
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            titles += [book['title'] for book in response.data['results']]
+            url = response.data['next']
+        
+        # The 24 extra books plus The Lord of the Rings, each exactly once
+        self.assertEqual(len(titles), 25)
+        self.assertEqual(len(set(titles)), 25)
+        self.assertEqual(titles[-1], "The Lord of the Rings")
+    
+    def test_author_books_unknown_author(self):
+        """Test the author books endpoint for an author that doesn't exist."""
+        response = self.client.get(_url('api:author-books', 999))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
 class CustomEndpointsTestCase(BaseAPITestCase):
     """
     Test cases for custom API endpoints.
@@ -553,53 +756,90 @@ class CustomEndpointsTestCase(BaseAPITestCase):
     
     def test_book_stats_endpoint(self):
         """Test book statistics endpoint."""
-        url = reverse('api:book-stats')
+        url = BOOK_STATS_URL
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data
         
         # Check required statistics fields
-        required_fields = ['total_books', 'total_authors', 'latest_book', 'oldest_book', 'books_by_decade']
-        for field in required_fields:
-            self.assertIn(field, response.data)
+        self.assertLessEqual(_REQUIRED_STATS, data.keys())
         
         # Verify data correctness
+        self.assertEqual(data['total_books'], 3)
+        self.assertEqual(data['total_authors'], 3)
+        self.assertEqual(data['latest_book']['year'], 1997)
+        self.assertEqual(data['oldest_book']['year'], 1954)
+    
+    def test_book_stats_cache_invalidated_on_write(self):
+        """Test that cached statistics are dropped when a book is saved."""
+        # Rolling back the test transaction does not fire signals, so clear
+        # the entry ourselves instead of leaking these stats to other tests
+        cache.delete(BOOK_STATS_CACHE_KEY)
+        self.addCleanup(cache.delete, BOOK_STATS_CACHE_KEY)
+        
+        response = self.client.get(BOOK_STATS_URL)
+        self.assertEqual(response.data['total_books'], 3)
+        
+        # A warm cache answers without touching the database
+        with self.assertNumQueries(0):
+            response = self.client.get(BOOK_STATS_URL)
         self.assertEqual(response.data['total_books'], 3)
-        self.assertEqual(response.data['total_authors'], 3)
-        self.assertEqual(response.data['latest_book']['year'], 1997)
-        self.assertEqual(response.data['oldest_book']['year'], 1954)
+        
+        Book.objects.create(title="Carrie", publication_year=2005, author=self.author3)
+        
+        response = self.client.get(BOOK_STATS_URL)
+        self.assertEqual(response.data['total_books'], 4)
+        self.assertEqual(response.data['latest_book']['title'], "Carrie")
+    
+    def test_book_stats_conditional_get(self):
+        """Test that unchanged statistics are answered with 304 Not Modified."""
+        cache.delete(BOOK_STATS_CACHE_KEY)
+        self.addCleanup(cache.delete, BOOK_STATS_CACHE_KEY)
+        
+        response = self.client.get(BOOK_STATS_URL)
+        etag = response['ETag']
+        self.assertIn('must-revalidate', response['Cache-Control'])
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(BOOK_STATS_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        
+        Book.objects.create(title="Carrie", publication_year=2005, author=self.author3)
+        
+        response = self.client.get(BOOK_STATS_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
     
     def test_my_books_endpoint_authenticated(self):
         """Test user-specific books endpoint with authentication."""
-        self.authenticate_user()
-        
-        url = reverse('api:my-books')
-        response = self.client.get(url)
+        url = MY_BOOKS_URL
+        response = self.auth_client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('user', response.data)
-        self.assertEqual(response.data['user'], 'testuser')
+        data = response.data
+        self.assertIn('user', data)
+        self.assertEqual(data['user'], 'testuser')
     
     def test_my_books_endpoint_unauthenticated(self):
         """Test user-specific books endpoint without authentication."""
         self.unauthenticate()
         
-        url = reverse('api:my-books')
+        url = MY_BOOKS_URL
         response = self.client.get(url)
         
         self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
     
     def test_custom_book_update_endpoint(self):
         """Test custom book update endpoint."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-update-endpoint')
+        url = BOOK_UPDATE_ENDPOINT_URL
         data = {
             'id': self.book1.id,
             'title': 'Updated via Custom Endpoint'
         }
         
-        response = self.client.patch(url, data, format='json')
+        response = self.auth_client.patch(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('message', response.data)
@@ -607,25 +847,31 @@ class CustomEndpointsTestCase(BaseAPITestCase):
     
     def test_custom_book_update_endpoint_missing_id(self):
         """Test custom book update endpoint without book ID."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-update-endpoint')
+        url = BOOK_UPDATE_ENDPOINT_URL
         data = {'title': 'No ID Provided'}
         
-        response = self.client.patch(url, data, format='json')
+        response = self.auth_client.patch(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(response.data['status'], 'error')
     
+    def test_custom_book_update_endpoint_invalid_data(self):
+        """Test custom book update endpoint with invalid field values."""
+        data = {'id': self.book1.id, 'publication_year': 500}
+        
+        response = self.auth_client.patch(BOOK_UPDATE_ENDPOINT_URL, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['message'], 'Book update failed')
+        self.assertIn('publication_year', response.data['errors'])
+    
     def test_custom_book_delete_endpoint(self):
         """Test custom book delete endpoint."""
-        self.authenticate_user()
-        
         book_id = self.book1.id
-        url = reverse('api:book-delete-endpoint')
+        url = BOOK_DELETE_ENDPOINT_URL
         data = {'id': book_id}
         
-        response = self.client.delete(url, data, format='json')
+        response = self.auth_client.delete(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('deleted_book', response.data)
@@ -633,6 +879,50 @@ class CustomEndpointsTestCase(BaseAPITestCase):
         
         # Verify book was deleted
         self.assertFalse(Book.objects.filter(id=book_id).exists())
+    
+    def test_custom_book_update_endpoint_bulk(self):
+        """Test updating several books at once through the custom endpoint."""
+        ids = [self.book1.id, self.book2.id]
+        data = {'ids': ids, 'publication_year': 2000}
+        
+        response = self.auth_client.patch(BOOK_UPDATE_ENDPOINT_URL, data, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['updated'], 2)
+        self.assertEqual(
+            set(Book.objects.filter(pk__in=ids).values_list('publication_year', flat=True)),
+            {2000}
+        )
+        self.assertEqual(Book.objects.get(pk=self.book3.id).publication_year, 1977)
+        
+        # Values are validated exactly like single-book updates
+        data = {'ids': ids, 'publication_year': 500}
+        response = self.auth_client.patch(BOOK_UPDATE_ENDPOINT_URL, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('publication_year', response.data['errors'])
+    
+    def test_custom_book_delete_endpoint_bulk(self):
+        """Test deleting several books at once through the custom endpoint."""
+        ids = [self.book1.id, self.book2.id]
+        author_modified = Author.objects.get(pk=self.author1.pk).updated_at
+        
+        # Savepoint, SELECT, DELETE, one author UPDATE and release, not a
+        # query per book
+        with self.assertNumQueries(5):
+            response = self.auth_client.delete(BOOK_DELETE_ENDPOINT_URL, {'ids': ids}, format='json')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['deleted'], 2)
+        self.assertFalse(Book.objects.filter(pk__in=ids).exists())
+        self.assertTrue(Book.objects.filter(pk=self.book3.id).exists())
+        # The owning authors are still invalidated
+        self.assertGreater(Author.objects.get(pk=self.author1.pk).updated_at, author_modified)
+        
+        # Malformed and unknown ids are rejected
+        response = self.auth_client.delete(BOOK_DELETE_ENDPOINT_URL, {'ids': 'all'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.auth_client.delete(BOOK_DELETE_ENDPOINT_URL, {'ids': [999]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
 class PermissionAndAuthenticationTestCase(BaseAPITestCase):
@@ -651,78 +941,70 @@ class PermissionAndAuthenticationTestCase(BaseAPITestCase):
         self.unauthenticate()
         
         # Test book list
-        response = self.client.get(reverse('api:book-list'))
+        response = self.client.get(BOOK_LIST_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Test book detail
-        response = self.client.get(reverse('api:book-detail', kwargs={'pk': self.book1.id}))
+        response = self.client.get(_url('api:book-detail', self.book1.id))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Test author list
-        response = self.client.get(reverse('api:author-list'))
+        response = self.client.get(AUTHOR_LIST_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Test author detail
-        response = self.client.get(reverse('api:author-detail', kwargs={'pk': self.author1.id}))
+        response = self.client.get(_url('api:author-detail', self.author1.id))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Test book stats
-        response = self.client.get(reverse('api:book-stats'))
+        response = self.client.get(BOOK_STATS_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
     
-    def test_authenticated_write_access(self):
-        """Test that write operations require authentication."""
-        operations = [
-            ('POST', reverse('api:book-create'), {'title': 'Test', 'publication_year': 2023, 'author': self.author1.id}),
-            ('PUT', reverse('api:book-update', kwargs={'pk': self.book1.id}), {'title': 'Updated', 'publication_year': 2023, 'author': self.author1.id}),
-            ('PATCH', reverse('api:book-update', kwargs={'pk': self.book1.id}), {'title': 'Patched'}),
-            ('DELETE', reverse('api:book-delete', kwargs={'pk': self.book1.id}), {}),
+    def _write_operations(self):
+        """Write requests covering every mutating book endpoint, DELETE last."""
+        return [
+            ('POST', BOOK_CREATE_URL, {'title': 'Test', 'publication_year': 2023, 'author': self.author1.id}),
+            ('PUT', _url('api:book-update', self.book1.id), {'title': 'Updated', 'publication_year': 2023, 'author': self.author1.id}),
+            ('PATCH', _url('api:book-update', self.book1.id), {'title': 'Patched'}),
+            ('DELETE', _url('api:book-delete', self.book1.id), {}),
         ]
-        
-        for method, url, data in operations:
-            # Test unauthenticated access
-            self.unauthenticate()
-            if method == 'POST':
-                response = self.client.post(url, data, format='json')
-            elif method == 'PUT':
-                response = self.client.put(url, data, format='json')
-            elif method == 'PATCH':
-                response = self.client.patch(url, data, format='json')
-            elif method == 'DELETE':
-                response = self.client.delete(url)
-            
-            self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
-            
-            # Test authenticated access (should work)
-            self.authenticate_user()
-            if method == 'POST':
-                response = self.client.post(url, data, format='json')
-                self.assertIn(response.status_code, [status.HTTP_201_CREATED, status.HTTP_400_BAD_REQUEST])
-            elif method in ['PUT', 'PATCH']:
-                response = self.client.patch(url, data, format='json')
-                self.assertIn(response.status_code, [status.HTTP_200_OK, status.HTTP_400_BAD_REQUEST])
-            elif method == 'DELETE':
-                response = self.client.delete(url)
-                self.assertEqual(response.status_code, status.HTTP_200_OK)
-                break  # Only delete once
+    
+    def test_unauthenticated_write_access_denied(self):
+        """Test that write operations are rejected without authentication."""
+        for method, url, data in self._write_operations():
+            with self.subTest(method=method):
+                response = getattr(self.client, method.lower())(url, data, format='json')
+                self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
+    
+    def test_authenticated_write_access(self):
+        """Test that write operations succeed for authenticated users."""
+        expected = {
+            'POST': [status.HTTP_201_CREATED, status.HTTP_400_BAD_REQUEST],
+            'PUT': [status.HTTP_200_OK, status.HTTP_400_BAD_REQUEST],
+            'PATCH': [status.HTTP_200_OK, status.HTTP_400_BAD_REQUEST],
+            'DELETE': [status.HTTP_200_OK],
+        }
+        for method, url, data in self._write_operations():
+            with self.subTest(method=method):
+                response = getattr(self.auth_client, method.lower())(url, data, format='json')
+                self.assertIn(response.status_code, expected[method])
     
     def test_custom_endpoints_authentication(self):
         """Test authentication requirements for custom endpoints."""
-        # my-books requires authentication
-        self.unauthenticate()
-        response = self.client.get(reverse('api:my-books'))
+        # my-books requires authentication; self.client is never authenticated
+        # here, so the authenticated request goes through auth_client instead
+        # of toggling force_authenticate back and forth
+        response = self.client.get(MY_BOOKS_URL)
         self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
         
-        self.authenticate_user()
-        response = self.client.get(reverse('api:my-books'))
+        response = self.auth_client.get(MY_BOOKS_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Custom update/delete require authentication
-        self.unauthenticate()
-        response = self.client.patch(reverse('api:book-update-endpoint'), {'id': self.book1.id})
+        response = self.client.patch(BOOK_UPDATE_ENDPOINT_URL, {'id': self.book1.id})
         self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
         
-        response = self.client.delete(reverse('api:book-delete-endpoint'), {'id': self.book1.id})
+        response = self.client.delete(BOOK_DELETE_ENDPOINT_URL, {'id': self.book1.id})
         self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
     
     def test_session_based_authentication(self):
@@ -731,13 +1013,10 @@ class PermissionAndAuthenticationTestCase(BaseAPITestCase):
         self.client.logout()
         
         # Try to create a book without authentication
-        url = reverse('api:book-create')
-        data = {
-            'title': 'Session Test Book',
-            'publication_year': 2023,
-            'author': self.author1.id
-        }
-        response = self.client.post(url, data, format='json')
+        url = BOOK_CREATE_URL
+        # Sent twice, so encode the body once instead of rendering it per request
+        body = json.dumps(self.book_payload(title='Session Test Book'))
+        response = self.client.post(url, body, content_type='application/json')
         self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
         
         # Test with session-based login
@@ -745,18 +1024,18 @@ class PermissionAndAuthenticationTestCase(BaseAPITestCase):
         self.assertTrue(login_successful, "Login should be successful with correct credentials")
         
         # Now try creating a book with session authentication
-        response = self.client.post(url, data, format='json')
+        response = self.client.post(url, body, content_type='application/json')
         self.assertIn(response.status_code, [status.HTTP_201_CREATED, status.HTTP_400_BAD_REQUEST])
         
         # Test access to user-specific endpoints
-        response = self.client.get(reverse('api:my-books'))
+        response = self.client.get(MY_BOOKS_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Clean up - logout
         self.client.logout()
         
         # Verify logout worked
-        response = self.client.get(reverse('api:my-books'))
+        response = self.client.get(MY_BOOKS_URL)
         self.assertIn(response.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN])
 
 
@@ -773,42 +1052,44 @@ class DataValidationTestCase(BaseAPITestCase):
     
     def test_publication_year_validation(self):
         """Test publication year custom validation."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-create')
+        url = BOOK_CREATE_URL
         
         # Test future year (should fail)
-        data = {
-            'title': 'Future Book',
-            'publication_year': 2050,
-            'author': self.author1.id
-        }
-        response = self.client.post(url, data, format='json')
+        data = self.book_payload(title='Future Book', publication_year=2050)
+        response = self.auth_client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('errors', response.data)
         
         # Test very old year (should fail)
         data['publication_year'] = 500
-        response = self.client.post(url, data, format='json')
+        response = self.auth_client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
         # Test valid year (should pass)
         data['publication_year'] = 2020
-        response = self.client.post(url, data, format='json')
+        response = self.auth_client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
     
+    def test_current_year_refreshes_at_new_year(self):
+        """Test the cached current year is re-read once its year has ended."""
+        this_year = datetime.now().year
+        # Cached value left over from last year, which ended a moment ago
+        with mock.patch.multiple(
+            serializers, _current_year=this_year - 1, _current_year_ends_at=time.time() - 1
+        ):
+            self.assertEqual(serializers.get_current_year(), this_year)
+            self.assertGreater(serializers._current_year_ends_at, time.time())
+    
     def test_required_fields_validation(self):
         """Test that required fields are validated."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-create')
+        url = BOOK_CREATE_URL
         
         # Test missing title
         data = {
             'publication_year': 2023,
             'author': self.author1.id
         }
-        response = self.client.post(url, data, format='json')
+        response = self.auth_client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
         # Test missing author
@@ -816,7 +1097,7 @@ class DataValidationTestCase(BaseAPITestCase):
             'title': 'Test Book',
             'publication_year': 2023
         }
-        response = self.client.post(url, data, format='json')
+        response = self.auth_client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         
         # Test missing publication_year
@@ -824,21 +1105,15 @@ class DataValidationTestCase(BaseAPITestCase):
             'title': 'Test Book',
             'author': self.author1.id
         }
-        response = self.client.post(url, data, format='json')
+        response = self.auth_client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
     
     def test_author_validation(self):
         """Test author field validation."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-create')
-        data = {
-            'title': 'Test Book',
-            'publication_year': 2023,
-            'author': 999  # Non-existent author
-        }
+        url = BOOK_CREATE_URL
+        data = self.book_payload(author=999)  # Non-existent author
         
-        response = self.client.post(url, data, format='json')
+        response = self.auth_client.post(url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('errors', response.data)
 
@@ -854,36 +1129,42 @@ class ErrorHandlingTestCase(BaseAPITestCase):
     - Proper error response formats
     """
     
+    # URLs of resources that never exist, resolved once for the class
+    MISSING_BOOK_DETAIL_URL = _url('api:book-detail', 999)
+    MISSING_BOOK_UPDATE_URL = _url('api:book-update', 999)
+    MISSING_BOOK_DELETE_URL = _url('api:book-delete', 999)
+    MISSING_AUTHOR_DETAIL_URL = _url('api:author-detail', 999)
+    
     def test_nonexistent_book_operations(self):
         """Test operations on non-existent books."""
-        self.authenticate_user()
-        
         # Test detail view
-        response = self.client.get(reverse('api:book-detail', kwargs={'pk': 999}))
+        response = self.auth_client.get(self.MISSING_BOOK_DETAIL_URL)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        # DRF's detail is kept alongside the API's message/status keys
+        self.assertIn('detail', response.data)
+        self.assertEqual(response.data['message'], response.data['detail'])
+        self.assertEqual(response.data['status'], 'error')
         
         # Test update
-        response = self.client.patch(reverse('api:book-update', kwargs={'pk': 999}), {'title': 'Test'})
+        response = self.auth_client.patch(self.MISSING_BOOK_UPDATE_URL, {'title': 'Test'})
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         
         # Test delete
-        response = self.client.delete(reverse('api:book-delete', kwargs={'pk': 999}))
+        response = self.auth_client.delete(self.MISSING_BOOK_DELETE_URL)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
     
     def test_nonexistent_author_operations(self):
         """Test operations on non-existent authors."""
         # Test detail view
-        response = self.client.get(reverse('api:author-detail', kwargs={'pk': 999}))
+        response = self.client.get(self.MISSING_AUTHOR_DETAIL_URL)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
     
     def test_malformed_json_request(self):
         """Test handling of malformed JSON requests."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-create')
+        url = BOOK_CREATE_URL
         
         # Send malformed JSON
-        response = self.client.post(
+        response = self.auth_client.post(
             url, 
             'malformed json{', 
             content_type='application/json'
@@ -892,22 +1173,35 @@ class ErrorHandlingTestCase(BaseAPITestCase):
     
     def test_empty_request_body(self):
         """Test handling of empty request bodies."""
-        self.authenticate_user()
-        
-        url = reverse('api:book-create')
-        response = self.client.post(url, {}, format='json')
+        url = BOOK_CREATE_URL
+        response = self.auth_client.post(url, {}, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('errors', response.data)
 
 
-# Test runner helper for specific test execution
+class ORJSONRendererTestCase(SimpleTestCase):
+    """Test that the API's renderer matches DRF's JSONRenderer output."""
+    
+    def test_matches_json_renderer(self):
+        """Test line separators and UTC datetimes render like JSONRenderer."""
+        data = {
+            'title': 'Line\u2028Paragraph\u2029End',
+            'updated_at': datetime(2024, 5, 1, 12, 30, tzinfo=dt_timezone.utc),
+        }
+        
+        rendered = ORJSONRenderer().render(data)
+        
+        self.assertEqual(rendered, JSONRenderer().render(data))
+        self.assertIn(b'\\u2028', rendered)
+
+
+# Test runner helper for specific test execution: runs this module through
+# pytest-django, whose pytest.ini --nomigrations option builds the test
+# schema straight from the models instead of replaying every migration
 if __name__ == '__main__':
-    import django
-    from django.test.utils import get_runner
-    from django.conf import settings
-    
-    django.setup()
-    TestRunner = get_runner(settings)
-    test_runner = TestRunner()
-    failures = test_runner.run_tests(["api.test_views"])
+    import sys
+    
+    import pytest
+    
+    sys.exit(pytest.main([__file__]))
@@ -15,6 +15,7 @@ URL Patterns:
     /api/books/<int:pk>/delete/ - Delete book (DELETE)
     /api/authors/ - List all authors (GET)
     /api/authors/<int:pk>/ - Get author detail (GET)
+    /api/authors/<int:pk>/books/ - List all books of an author (GET)
     /api/books/stats/ - Get book statistics (GET)
     /api/my-books/ - Get user's books (GET) [Authenticated]
 """
@@ -40,6 +41,7 @@ urlpatterns = [
     # Author endpoints
     path('authors/', views.AuthorListView.as_view(), name='author-list'),
     path('authors/<int:pk>/', views.AuthorDetailView.as_view(), name='author-detail'),
+    path('authors/<int:pk>/books/', views.AuthorBooksView.as_view(), name='author-books'),
     
     # Custom endpoints
     path('books/stats/', views.book_stats, name='book-stats'),
@@ -51,7 +53,7 @@ URL Pattern Documentation:
 
 1. Book CRUD Operations:
    - GET /api/books/ 
-     * Returns paginated list of all books
+     * Returns cursor-paginated list of all books (?cursor=<token> from next/previous)
      * Supports filtering: ?author=1&publication_year=2020
      * Supports searching: ?search=harry potter
      * Supports ordering: ?ordering=-publication_year,title
@@ -78,12 +80,15 @@ URL Pattern Documentation:
 
 2. Author Operations:
    - GET /api/authors/
-     * Returns list of all authors with their books
+     * Returns list of all authors with their most recent books (up to 20)
      * Supports searching: ?search=author name
      * Supports ordering: ?ordering=name
    
    - GET /api/authors/<id>/
-     * Returns detailed author information with all their books
+     * Returns detailed author information with their most recent books
+   
+   - GET /api/authors/<id>/books/
+     * Returns all books of the author, newest first, cursor-paginated
 
 3. Custom Endpoints:
    - GET /api/books/stats/
@@ -95,7 +100,7 @@ URL Pattern Documentation:
      * Requires authentication
 
 Permission Summary:
-- Public Access (AllowAny): Book list, book detail, author list, author detail, book stats
+- Public Access (AllowAny): Book list, book detail, author list, author detail, author books, book stats
 - Authenticated Only (IsAuthenticated): Book create, book update, book delete, my books
 
 Response Formats:
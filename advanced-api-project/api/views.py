@@ -1,17 +1,211 @@
-from django.shortcuts import render
+import hashlib
+import json
+import logging
+
+from django.core.cache import cache
+from django.shortcuts import get_object_or_404, render
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max, Min, Prefetch
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.decorators import method_decorator
+from django.utils.http import quote_etag
+from django.views.decorators.http import condition
 from rest_framework import generics, permissions, status
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
 from django_filters import rest_framework
 from rest_framework import filters
 
-from .models import Author, Book
-from .serializers import AuthorSerializer, BookSerializer, SimpleAuthorSerializer, SimpleBookSerializer
+from .cache_keys import BOOK_STATS_CACHE_KEY
+from .filters import BookFilter
+from .models import Author, Book, Decade
+from .serializers import (
+    AUTHOR_RECENT_BOOKS_LIMIT, AuthorSerializer, BookBulkUpdateSerializer, BookSerializer, SimpleAuthorSerializer,
+    SimpleBookSerializer,
+)
+from .signals import batched_invalidation
+
+logger = logging.getLogger(__name__)
 
 # Create your views here.
 
-class BookListView(generics.ListAPIView):
+# Query optimization mixins
+# Views declare the relations their serializer touches as class attributes
+# and the mixins apply them in get_queryset(), so nested serialization
+# never falls back to one query per object.
+
+class SelectRelatedMixin:
+    """
+    Apply `select_related` to the view's queryset.
+    
+    Use for forward foreign keys read by the serializer
+    (e.g. `SimpleBookSerializer.author_name` -> `author`).
+    """
+    select_related = ()
+    
+    def get_select_related(self):
+        """Return the relations to join; override to decide per request."""
+        return self.select_related
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        select_related = self.get_select_related()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        return queryset
+
+
+class PrefetchRelatedMixin:
+    """
+    Apply `prefetch_related` to the view's queryset.
+    
+    Use for reverse/many relations rendered by nested serializers
+    (e.g. `AuthorSerializer.books`). Entries may be lookup strings or
+    `Prefetch` objects.
+    """
+    prefetch_related = ()
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        return queryset
+
+
+class SerializerOnlyFieldsMixin:
+    """
+    Restrict the view's queryset to the serializer's `serializer_only_fields`.
+    
+    Serializers that declare the columns they read (e.g. SimpleBookSerializer)
+    get a narrowed `.only(...)` projection automatically; others are untouched.
+    Combine with SelectRelatedMixin when the fields span a relation.
+    """
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        only_fields = getattr(self.get_serializer_class(), 'serializer_only_fields', None)
+        if only_fields:
+            queryset = queryset.only(*only_fields)
+        return queryset
+
+
+class ResponseEnvelopeMixin:
+    """
+    Wrap a generic view's responses in the API's message/status envelope.
+    
+    Successful responses become
+    `{'message': success_message, <envelope_key>: data, 'status': 'success'}`,
+    so views can rely on DRF's stock create()/update() instead of
+    re-implementing them just to change the response shape. Validation
+    failures are wrapped by api.exceptions.api_exception_handler, which uses
+    error_message as their message.
+    """
+    envelope_key = 'data'
+    success_message = None
+    error_message = None
+    
+    def finalize_response(self, request, response, *args, **kwargs):
+        if (
+            self.success_message
+            and request.method not in permissions.SAFE_METHODS
+            and isinstance(response, Response)
+            and not response.exception
+            and status.is_success(response.status_code)
+        ):
+            response.data = {
+                'message': self.success_message,
+                self.envelope_key: response.data,
+                'status': 'success'
+            }
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class BookCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the book list.
+    
+    Each page continues from the last row of the previous one
+    (`WHERE publication_year < ...`) instead of an OFFSET that scans and
+    discards every earlier row, so deep pages cost the same as the first.
+    The view's OrderingFilter still picks the ordering; `ordering` here is
+    only the fallback.
+    """
+    ordering = ('-publication_year', '-id')
+    
+    def get_ordering(self, request, queryset, view):
+        # Rows sharing the cursor field are told apart by their offset within
+        # the tie, so the order inside a tie must be the same on every page;
+        # break ties on id rather than leaving them to the query plan
+        ordering = tuple(super().get_ordering(request, queryset, view))
+        if not {'id', '-id', 'pk', '-pk'} & set(ordering):
+            ordering += ('-id' if ordering[0].startswith('-') else 'id',)
+        return ordering
+    
+    def _get_position_from_instance(self, instance, ordering):
+        # Follow related lookups such as `?ordering=author__name`, which the
+        # base class would try to read as a single attribute
+        value = instance
+        for attr in ordering[0].lstrip('-').split('__'):
+            value = value[attr] if isinstance(value, dict) else getattr(value, attr)
+        return str(value)
+
+
+# Books rendered by the nested BookSerializer inside AuthorSerializer: each
+# author's most recent AUTHOR_RECENT_BOOKS_LIMIT books (a sliced prefetch,
+# still one query for all authors), restricted to the columns it serializes.
+# An author's full list is paginated by AuthorBooksView.
+AUTHOR_BOOKS_PREFETCH = Prefetch(
+    'books',
+    queryset=(
+        Book.objects
+        .only('id', 'title', 'publication_year', 'author_id')
+        .order_by('-publication_year', 'title')
+    )[:AUTHOR_RECENT_BOOKS_LIMIT],
+    to_attr='recent_books',
+)
+
+
+# Conditional GET (ETag / Last-Modified) for the book detail view. A book
+# payload only changes when the book or its author changes, and both bump
+# updated_at (see api.signals), so their newest updated_at identifies a
+# response. Only JSON responses are validated: the browsable API also
+# renders per-user content. The list view is not validated: a list-wide
+# version would need a table-wide aggregate on every request, which is the
+# per-request cost cursor pagination avoids.
+
+def _book_detail_state(request, pk):
+    """Version of a single book and its author, computed once per request."""
+    if request.accepted_renderer.format != 'json':
+        return None
+    if not hasattr(request, '_book_detail_state'):
+        request._book_detail_state = (
+            Book.objects.filter(pk=pk)
+            .values('updated_at', 'author__updated_at')
+            .first()
+        )
+    return request._book_detail_state
+
+
+def _newest(*timestamps):
+    return max((t for t in timestamps if t is not None), default=None)
+
+
+def book_detail_last_modified(request, pk, *args, **kwargs):
+    state = _book_detail_state(request, pk)
+    if state:
+        return _newest(state['updated_at'], state['author__updated_at'])
+
+
+def book_detail_etag(request, pk, *args, **kwargs):
+    modified = book_detail_last_modified(request, pk)
+    if modified:
+        return f"book-{pk}-{modified.timestamp()}"
+
+
+class BookListView(SerializerOnlyFieldsMixin, SelectRelatedMixin, generics.ListAPIView):
     """
     Generic ListView for retrieving all books with advanced filtering, searching, and ordering.
     
@@ -22,7 +216,7 @@ class BookListView(generics.ListAPIView):
         - Read-only access for all users (authenticated and unauthenticated)
     
     Features:
-        - Returns paginated list of all books
+        - Returns a cursor-paginated list of all books (follow `next`/`previous`)
         - Supports filtering by author, publication year, and custom date ranges
         - Supports search by title and author name
         - Supports ordering by multiple fields
@@ -42,6 +236,9 @@ class BookListView(generics.ListAPIView):
             ?ordering=<field> - Order by field (title, publication_year, author__name)
             ?ordering=-<field> - Reverse order (prefix with -)
             ?ordering=<field1>,<field2> - Multiple field ordering
+            
+        Help:
+            ?help=1 - Include descriptions of the available parameters
     
     Examples:
         GET /api/books/?author=1&publication_year=2020
@@ -52,20 +249,18 @@ class BookListView(generics.ListAPIView):
     
     URL: GET /api/books/
     """
-    queryset = Book.objects.all().select_related('author')  # Optimize queries
+    queryset = Book.objects.all()
     serializer_class = BookSerializer
     permission_classes = [permissions.AllowAny]  # Public read access
+    pagination_class = BookCursorPagination  # ?cursor=<token> instead of ?page=<n>
     
     # Step 1: Set Up Filtering - Configure filter backends
-    filter_backends = [rest_framework.DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = (rest_framework.DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter)
     
     # Step 1: Filtering Configuration
-    # Allow filtering by author (FK), publication_year, and title
-    filterset_fields = {
-        'author': ['exact'],  # Filter by exact author ID
-        'publication_year': ['exact', 'gte', 'lte'],  # Exact year, greater/less than
-        'title': ['icontains'],  # Case-insensitive partial match
-    }
+    # Field lookups on author (FK), publication_year and title, plus the custom
+    # year_from/year_to/author_name parameters (see api.filters.BookFilter)
+    filterset_class = BookFilter
     
     # Step 2: Search Functionality Configuration
     # Enable search across title and author name with case-insensitive matching
@@ -76,93 +271,70 @@ class BookListView(generics.ListAPIView):
     ordering_fields = ['title', 'publication_year', 'author__name', 'id']
     ordering = ['-publication_year', 'title']  # Default ordering: newest first, then alphabetical
     
-    def get_queryset(self):
-        """
-        Custom queryset filtering for advanced filtering capabilities.
-        
-        Implements custom filtering logic beyond basic DjangoFilterBackend:
-        - Publication year range filtering (year_from, year_to)
-        - Additional custom filters can be added here
-        
-        Returns:
-            QuerySet: Filtered queryset based on query parameters
-        """
-        queryset = super().get_queryset()
-        
-        # Custom filter: Publication year range
-        year_from = self.request.query_params.get('year_from')
-        year_to = self.request.query_params.get('year_to')
-        
-        if year_from:
-            try:
-                year_from = int(year_from)
-                queryset = queryset.filter(publication_year__gte=year_from)
-            except ValueError:
-                pass  # Ignore invalid year format
-                
-        if year_to:
-            try:
-                year_to = int(year_to)
-                queryset = queryset.filter(publication_year__lte=year_to)
-            except ValueError:
-                pass  # Ignore invalid year format
-        
-        # Custom filter: Books by specific author name (case-insensitive)
-        author_name = self.request.query_params.get('author_name')
-        if author_name:
-            queryset = queryset.filter(author__name__icontains=author_name)
-            
-        return queryset
+    # Parameter help, built once and only sent when asked for with ?help=1
+    available_filters = {
+        'author': 'Filter by author ID (exact match)',
+        'publication_year': 'Filter by publication year (exact, gte, lte)',
+        'title': 'Filter by title (case-insensitive partial match)',
+        'year_from': 'Custom filter: books from this year onwards',
+        'year_to': 'Custom filter: books up to this year',
+        'author_name': 'Custom filter: books by author name (partial match)'
+    }
+    available_search = 'Search in: title, author name'
+    available_ordering = 'Order by: title, publication_year, author__name, id (prefix with - for descending)'
+    non_filter_params = frozenset(['search', 'ordering', 'cursor', 'help'])
+    
+    def get_select_related(self):
+        # BookSerializer renders the author as its id, so the author row is
+        # only read when it is the cursor's position (?ordering=author__name);
+        # other requests query Book alone and join only to filter by name
+        if 'author__name' in self.request.query_params.get('ordering', ''):
+            return ['author']
+        return ()
+    
+    def get_filters_applied(self, query_params):
+        """Summarize the search, ordering and filter parameters of a request."""
+        filters_applied = {'search': None, 'ordering': self.ordering, 'filters': {}}
+        for key, values in query_params.lists():
+            if key == 'search' or key == 'ordering':
+                filters_applied[key] = values[-1]
+            elif key not in self.non_filter_params:
+                filters_applied['filters'][key] = values
+        return filters_applied
     
     def list(self, request, *args, **kwargs):
         """
         Override list method to provide additional context in response.
         
-        Returns filtering and ordering information along with results.
+        Returns filtering and ordering information along with results, plus
+        the available parameters when called with ?help=1. The filter
+        parameters themselves are parsed once, by BookFilter.
         """
         queryset = self.filter_queryset(self.get_queryset())
         
-        # Get query parameters for context
-        query_params = dict(request.query_params)
-        
         page = self.paginate_queryset(queryset)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
             response = self.get_paginated_response(serializer.data)
             
             # Add filtering context to response
-            response.data['filters_applied'] = {
-                'search': request.query_params.get('search', None),
-                'ordering': request.query_params.get('ordering', self.ordering),
-                'filters': {k: v for k, v in query_params.items() 
-                           if k not in ['search', 'ordering', 'page']}
-            }
-            response.data['available_filters'] = {
-                'author': 'Filter by author ID (exact match)',
-                'publication_year': 'Filter by publication year (exact, gte, lte)',
-                'title': 'Filter by title (case-insensitive partial match)',
-                'year_from': 'Custom filter: books from this year onwards',
-                'year_to': 'Custom filter: books up to this year',
-                'author_name': 'Custom filter: books by author name (partial match)'
-            }
-            response.data['available_search'] = 'Search in: title, author name'
-            response.data['available_ordering'] = 'Order by: title, publication_year, author__name, id (prefix with - for descending)'
+            response.data['filters_applied'] = self.get_filters_applied(request.query_params)
+            if request.query_params.get('help') == '1':
+                response.data['available_filters'] = self.available_filters
+                response.data['available_search'] = self.available_search
+                response.data['available_ordering'] = self.available_ordering
             
             return response
 
         serializer = self.get_serializer(queryset, many=True)
-        return Response({
-            'results': serializer.data,
-            'filters_applied': {
-                'search': request.query_params.get('search', None),
-                'ordering': request.query_params.get('ordering', self.ordering),
-                'filters': {k: v for k, v in query_params.items() 
-                           if k not in ['search', 'ordering']}
-            }
-        })
+        return Response({'results': serializer.data})
 
 
-class BookDetailView(generics.RetrieveAPIView):
+@method_decorator(
+    condition(etag_func=book_detail_etag, last_modified_func=book_detail_last_modified),
+    name='get',
+)
+class BookDetailView(SerializerOnlyFieldsMixin, generics.RetrieveAPIView):
     """
     Generic DetailView for retrieving a single book by ID.
     
@@ -173,12 +345,13 @@ class BookDetailView(generics.RetrieveAPIView):
     
     Features:
         - Returns detailed information about a specific book
-        - Includes related author information
+        - Includes the author's id
         - Returns 404 if book doesn't exist
+        - Conditional GET: unchanged books are answered with 304 Not Modified
     
     URL: GET /api/books/<int:pk>/
     """
-    queryset = Book.objects.all().select_related('author')
+    queryset = Book.objects.all()
     serializer_class = BookSerializer
     permission_classes = [permissions.AllowAny]  # Public read access
     
@@ -191,7 +364,7 @@ class BookDetailView(generics.RetrieveAPIView):
         return obj
 
 
-class BookCreateView(generics.CreateAPIView):
+class BookCreateView(ResponseEnvelopeMixin, generics.CreateAPIView):
     """
     Generic CreateView for adding a new book.
     
@@ -212,6 +385,11 @@ class BookCreateView(generics.CreateAPIView):
     serializer_class = BookSerializer
     permission_classes = [IsAuthenticated]  # Require authentication
     
+    # Custom response formatting (see ResponseEnvelopeMixin)
+    envelope_key = 'book'
+    success_message = 'Book created successfully'
+    error_message = 'Book creation failed'
+    
     def perform_create(self, serializer):
         """
         Customize the creation process.
@@ -222,48 +400,13 @@ class BookCreateView(generics.CreateAPIView):
         # Example: Set additional metadata or perform logging
         book = serializer.save()
         
-        # Log book creation (in a real app, use proper logging)
-        print(f"New book created: {book.title} by {book.author.name}")
+        # Log book creation; author_id avoids loading the author just to log it
+        logger.info("New book created: %s (id=%s, author_id=%s)", book.title, book.pk, book.author_id)
         
         return book
-    
-    def create(self, request, *args, **kwargs):
-        """
-        Override create method to provide custom response formatting.
-        """
-        serializer = self.get_serializer(data=request.data)
-        
-        if serializer.is_valid():
-            self.perform_create(serializer)
-            headers = self.get_success_headers(serializer.data)
-            
-            # Custom success response
-            response_data = {
-                'message': 'Book created successfully',
-                'book': serializer.data,
-                'status': 'success'
-            }
-            
-            return Response(
-                response_data, 
-                status=status.HTTP_201_CREATED, 
-                headers=headers
-            )
-        else:
-            # Custom error response
-            response_data = {
-                'message': 'Book creation failed',
-                'errors': serializer.errors,
-                'status': 'error'
-            }
-            
-            return Response(
-                response_data, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
 
 
-class BookUpdateView(generics.UpdateAPIView):
+class BookUpdateView(ResponseEnvelopeMixin, generics.UpdateAPIView):
     """
     Generic UpdateView for modifying an existing book.
     
@@ -286,6 +429,11 @@ class BookUpdateView(generics.UpdateAPIView):
     serializer_class = BookSerializer
     permission_classes = [IsAuthenticated]  # Require authentication
     
+    # Custom response formatting (see ResponseEnvelopeMixin)
+    envelope_key = 'book'
+    success_message = 'Book updated successfully'
+    error_message = 'Book update failed'
+    
     def perform_update(self, serializer):
         """
         Customize the update process.
@@ -295,44 +443,12 @@ class BookUpdateView(generics.UpdateAPIView):
         book = serializer.save()
         
         # Log book update
-        print(f"Book updated: {book.title} by {book.author.name}")
+        logger.info("Book updated: %s (id=%s, author_id=%s)", book.title, book.pk, book.author_id)
         
         return book
-    
-    def update(self, request, *args, **kwargs):
-        """
-        Override update method to provide custom response formatting.
-        """
-        partial = kwargs.pop('partial', False)
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data, partial=partial)
-        
-        if serializer.is_valid():
-            self.perform_update(serializer)
-            
-            # Custom success response
-            response_data = {
-                'message': 'Book updated successfully',
-                'book': serializer.data,
-                'status': 'success'
-            }
-            
-            return Response(response_data)
-        else:
-            # Custom error response
-            response_data = {
-                'message': 'Book update failed',
-                'errors': serializer.errors,
-                'status': 'error'
-            }
-            
-            return Response(
-                response_data, 
-                status=status.HTTP_400_BAD_REQUEST
-            )
 
 
-class BookDeleteView(generics.DestroyAPIView):
+class BookDeleteView(SelectRelatedMixin, generics.DestroyAPIView):
     """
     Generic DeleteView for removing a book.
     
@@ -350,6 +466,7 @@ class BookDeleteView(generics.DestroyAPIView):
     URL: DELETE /api/books/<int:pk>/delete/
     """
     queryset = Book.objects.all()
+    select_related = ['author']  # destroy() reports the author's name
     serializer_class = BookSerializer
     permission_classes = [IsAuthenticated]  # Require authentication
     
@@ -360,7 +477,7 @@ class BookDeleteView(generics.DestroyAPIView):
         This method is called before the instance is deleted.
         """
         # Log book deletion
-        print(f"Book deleted: {instance.title} by {instance.author.name}")
+        logger.info("Book deleted: %s (id=%s, author_id=%s)", instance.title, instance.pk, instance.author_id)
         
         # Perform the actual deletion
         instance.delete()
@@ -369,19 +486,17 @@ class BookDeleteView(generics.DestroyAPIView):
         """
         Override destroy method to provide custom response formatting.
         """
+        # get_object() is the only read: select_related already joined the
+        # author, so capture what the response reports before the delete
         instance = self.get_object()
-        book_info = {
-            'id': instance.id,
-            'title': instance.title,
-            'author': instance.author.name
-        }
+        book_id, title, author_name = instance.id, instance.title, instance.author.name
         
         self.perform_destroy(instance)
         
         # Custom success response
         response_data = {
             'message': 'Book deleted successfully',
-            'deleted_book': book_info,
+            'deleted_book': {'id': book_id, 'title': title, 'author': author_name},
             'status': 'success'
         }
         
@@ -393,7 +508,7 @@ class BookDeleteView(generics.DestroyAPIView):
 
 # Additional views for Author model
 
-class AuthorListView(generics.ListAPIView):
+class AuthorListView(PrefetchRelatedMixin, generics.ListAPIView):
     """
     Generic ListView for retrieving all authors with their books.
     
@@ -405,7 +520,8 @@ class AuthorListView(generics.ListAPIView):
     
     URL: GET /api/authors/
     """
-    queryset = Author.objects.all().prefetch_related('books')
+    queryset = Author.objects.only('id', 'name', 'updated_at')
+    prefetch_related = [AUTHOR_BOOKS_PREFETCH]
     serializer_class = AuthorSerializer
     permission_classes = [permissions.AllowAny]
     
@@ -415,19 +531,59 @@ class AuthorListView(generics.ListAPIView):
     ordering = ['name']
 
 
-class AuthorDetailView(generics.RetrieveAPIView):
+class AuthorDetailView(PrefetchRelatedMixin, generics.RetrieveAPIView):
     """
     Generic DetailView for retrieving a single author with their books.
     
     URL: GET /api/authors/<int:pk>/
     """
-    queryset = Author.objects.all().prefetch_related('books')
+    queryset = Author.objects.only('id', 'name', 'updated_at')
+    prefetch_related = [AUTHOR_BOOKS_PREFETCH]
     serializer_class = AuthorSerializer
     permission_classes = [permissions.AllowAny]
 
 
+class AuthorBookCursorPagination(BookCursorPagination):
+    """Keyset pagination in the order of book_author_year_title_idx."""
+    ordering = ('-publication_year', 'title')
+
+
+class AuthorBooksView(SerializerOnlyFieldsMixin, generics.ListAPIView):
+    """
+    Generic ListView for all books of one author, newest first.
+    
+    Author responses only nest the author's most recent
+    AUTHOR_RECENT_BOOKS_LIMIT books; this endpoint pages through the
+    complete list with cursors (follow `next`/`previous`).
+    
+    URL: GET /api/authors/<int:pk>/books/
+    """
+    queryset = Book.objects.all()
+    serializer_class = BookSerializer
+    permission_classes = [permissions.AllowAny]
+    pagination_class = AuthorBookCursorPagination
+    filter_backends = ()
+    
+    def get_queryset(self):
+        return super().get_queryset().filter(author_id=self.kwargs['pk'])
+    
+    def list(self, request, *args, **kwargs):
+        # An unknown author is a 404 rather than an empty page
+        get_object_or_404(Author.objects.only('id'), pk=self.kwargs['pk'])
+        return super().list(request, *args, **kwargs)
+
+
 # Custom API Views (function-based examples)
 
+# book_stats aggregates over every book; serve it from the cache (under
+# BOOK_STATS_CACHE_KEY) and let api.signals drop the entry when the
+# underlying data changes.
+BOOK_STATS_CACHE_TIMEOUT = 30
+
+# Fields book_update_endpoint may set on many books at once (see `ids`)
+BULK_UPDATE_FIELDS = ('title', 'publication_year', 'author')
+
+
 @api_view(['GET'])
 @permission_classes([permissions.AllowAny])
 def book_stats(request):
@@ -437,20 +593,49 @@ def book_stats(request):
     This demonstrates how to create custom endpoints that don't
     follow the standard CRUD pattern.
     
+    The result is cached for BOOK_STATS_CACHE_TIMEOUT seconds and dropped
+    whenever a book or author is saved or deleted (see api.signals). JSON
+    responses carry an ETag of the cached payload, so clients and proxies
+    revalidating with If-None-Match get a 304 without a body.
+    
     URL: GET /api/books/stats/
     """
-    total_books = Book.objects.count()
+    etag, stats = cache.get_or_set(BOOK_STATS_CACHE_KEY, _compute_book_stats, BOOK_STATS_CACHE_TIMEOUT)
+    response = Response(stats)
+    if request.accepted_renderer.format != 'json':
+        return response
+    
+    # Cacheable downstream, but revalidated on every use since writes
+    # invalidate the statistics immediately
+    response['ETag'] = etag
+    patch_cache_control(response, public=True, max_age=0, must_revalidate=True)
+    return get_conditional_response(request, etag=etag, response=response)
+
+
+def _compute_book_stats():
+    """Build the book_stats payload from the database, with its ETag."""
+    # One aggregate pass for the count and year bounds; the boundary books
+    # are then fetched with their authors joined in, rather than lazily
+    totals = Book.objects.aggregate(
+        total_books=Count('id'),
+        latest_year=Max('publication_year'),
+        oldest_year=Min('publication_year'),
+    )
+    total_books = totals['total_books']
     total_authors = Author.objects.count()
-    latest_book = Book.objects.order_by('-publication_year').first()
-    oldest_book = Book.objects.order_by('publication_year').first()
     
-    # Books per decade
-    from django.db.models import Count, IntegerField
-    from django.db.models.functions import Extract
+    latest_book = oldest_book = None
+    if total_books:
+        books = Book.objects.select_related('author').only(
+            'title', 'publication_year', 'author__name'
+        )
+        latest_book = books.filter(publication_year=totals['latest_year']).first()
+        oldest_book = books.filter(publication_year=totals['oldest_year']).first()
     
+    # Books per decade
     books_by_decade = (
         Book.objects
-        .extra(select={'decade': '(publication_year / 10) * 10'})
+        .annotate(decade=Decade('publication_year'))
         .values('decade')
         .annotate(count=Count('id'))
         .order_by('decade')
@@ -472,7 +657,8 @@ def book_stats(request):
         'books_by_decade': list(books_by_decade)
     }
     
-    return Response(stats)
+    digest = hashlib.sha1(json.dumps(stats, sort_keys=True).encode()).hexdigest()
+    return quote_etag(digest), stats
 
 
 @api_view(['GET'])
@@ -503,8 +689,14 @@ def book_update_endpoint(request):
     Function-based view for updating books.
     Expects book ID in request data.
     
+    Send `ids` (a list of book IDs) instead of `id` to apply the same
+    field values to many books with a single UPDATE statement.
+    
     URL: PUT/PATCH /api/books/update/
     """
+    if 'ids' in request.data:
+        return _bulk_update_books(request)
+    
     book_id = request.data.get('id')
     if not book_id:
         return Response({
@@ -512,28 +704,27 @@ def book_update_endpoint(request):
             'status': 'error'
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    try:
-        book = Book.objects.get(pk=book_id)
-    except Book.DoesNotExist:
-        return Response({
-            'message': 'Book not found',
-            'status': 'error'
-        }, status=status.HTTP_404_NOT_FOUND)
+    # save() writes every column, so the whole row is loaded here
+    book = get_object_or_404(Book, pk=book_id)
     
     serializer = BookSerializer(book, data=request.data, partial=True)
-    if serializer.is_valid():
-        serializer.save()
-        return Response({
-            'message': 'Book updated successfully',
-            'book': serializer.data,
-            'status': 'success'
-        })
-    else:
-        return Response({
-            'message': 'Book update failed',
-            'errors': serializer.errors,
-            'status': 'error'
-        }, status=status.HTTP_400_BAD_REQUEST)
+    if not serializer.is_valid():
+        return _book_update_failed(serializer.errors)
+    serializer.save()
+    return Response({
+        'message': 'Book updated successfully',
+        'book': serializer.data,
+        'status': 'success'
+    })
+
+
+def _book_update_failed(errors):
+    """Return book_update_endpoint's 400 response for the given field errors."""
+    return Response({
+        'message': 'Book update failed',
+        'errors': errors,
+        'status': 'error'
+    }, status=status.HTTP_400_BAD_REQUEST)
 
 
 @api_view(['DELETE'])
@@ -543,8 +734,14 @@ def book_delete_endpoint(request):
     Function-based view for deleting books.
     Expects book ID in request data.
     
+    Send `ids` (a list of book IDs) instead of `id` to delete many books
+    with a single DELETE statement.
+    
     URL: DELETE /api/books/delete/
     """
+    if 'ids' in request.data:
+        return _bulk_delete_books(request)
+    
     book_id = request.data.get('id')
     if not book_id:
         return Response({
@@ -552,17 +749,103 @@ def book_delete_endpoint(request):
             'status': 'error'
         }, status=status.HTTP_400_BAD_REQUEST)
     
+    book = get_object_or_404(
+        Book.objects.only(*BookSerializer.Meta.fields), pk=book_id
+    )
+    book_data = BookSerializer(book).data
+    book.delete()
+    return Response({
+        'message': 'Book deleted successfully',
+        'deleted_book': book_data,
+        'status': 'success'
+    })
+
+
+def _get_bulk_ids(request):
+    """Return the request's `ids` list, or None if it is not a non-empty list of integers."""
+    ids = request.data.get('ids')
+    if not isinstance(ids, list) or not ids:
+        return None
+    if not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+        return None
+    return ids
+
+
+def _bulk_update_books(request):
+    """Apply one set of validated field values to every book in `ids`."""
+    ids = _get_bulk_ids(request)
+    if ids is None:
+        return Response({
+            'message': 'ids must be a non-empty list of book IDs',
+            'status': 'error'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    fields = {k: v for k, v in request.data.items() if k in BULK_UPDATE_FIELDS}
+    if not fields:
+        return Response({
+            'message': f'Provide at least one of: {", ".join(BULK_UPDATE_FIELDS)}',
+            'status': 'error'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    serializer = BookBulkUpdateSerializer(data=fields, partial=True)
+    if not serializer.is_valid():
+        return _book_update_failed(serializer.errors)
+    
+    books = Book.objects.filter(pk__in=ids)
+    author_ids = set(books.values_list('author_id', flat=True))
+    now = timezone.now()
     try:
-        book = Book.objects.get(pk=book_id)
-        book_data = BookSerializer(book).data
-        book.delete()
+        with transaction.atomic():
+            updated = books.update(updated_at=now, **serializer.validated_data)
+    except IntegrityError:
+        return _book_update_failed(
+            {'title': ['Each author can only have one book with a given title.']}
+        )
+    
+    if not updated:
         return Response({
-            'message': 'Book deleted successfully',
-            'deleted_book': book_data,
-            'status': 'success'
-        })
-    except Book.DoesNotExist:
+            'message': 'No matching books found',
+            'status': 'error'
+        }, status=status.HTTP_404_NOT_FOUND)
+    
+    # QuerySet.update() sends no signals, so invalidate what api.signals would
+    if 'author' in serializer.validated_data:
+        author_ids.add(serializer.validated_data['author'].pk)
+    Author.objects.filter(pk__in=author_ids).update(updated_at=now)
+    cache.delete(BOOK_STATS_CACHE_KEY)
+    
+    return Response({
+        'message': 'Books updated successfully',
+        'updated': updated,
+        'status': 'success'
+    })
+
+
+def _bulk_delete_books(request):
+    """
+    Delete every book in `ids` in one transaction.
+    
+    Runs a fixed number of queries however many ids are sent: the books are
+    selected and deleted in one statement each, and the per-book signal
+    invalidation is batched into one UPDATE touching the owning authors.
+    """
+    ids = _get_bulk_ids(request)
+    if ids is None:
         return Response({
-            'message': 'Book not found',
+            'message': 'ids must be a non-empty list of book IDs',
+            'status': 'error'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    with transaction.atomic(), batched_invalidation():
+        deleted, _ = Book.objects.filter(pk__in=ids).delete()
+    if not deleted:
+        return Response({
+            'message': 'No matching books found',
             'status': 'error'
         }, status=status.HTTP_404_NOT_FOUND)
+    
+    return Response({
+        'message': 'Books deleted successfully',
+        'deleted': deleted,
+        'status': 'success'
+    })
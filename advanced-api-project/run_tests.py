@@ -15,27 +15,33 @@ import os
 import sys
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 def run_command(command, description):
     """Run a command and return the result."""
-    print(f"\n{'='*60}")
-    print(f"Running: {description}")
-    print(f"Command: {command}")
-    print(f"{'='*60}")
-    
     start_time = time.time()
     result = subprocess.run(command, shell=True, capture_output=True, text=True)
     end_time = time.time()
     
-    print(f"Duration: {end_time - start_time:.2f} seconds")
-    print(f"Exit Code: {result.returncode}")
+    # Commands may run concurrently, so the report is printed in one go
+    # once the command has finished rather than line by line
+    report = [
+        f"\n{'='*60}",
+        f"Running: {description}",
+        f"Command: {command}",
+        f"{'='*60}",
+        f"Duration: {end_time - start_time:.2f} seconds",
+        f"Exit Code: {result.returncode}",
+    ]
     
     if result.stdout:
-        print(f"\nOutput:\n{result.stdout}")
+        report.append(f"\nOutput:\n{result.stdout}")
     
     if result.stderr:
-        print(f"\nErrors:\n{result.stderr}")
+        report.append(f"\nErrors:\n{result.stderr}")
+    
+    print("\n".join(report), flush=True)
     
     return result.returncode == 0, result
 
@@ -69,21 +75,32 @@ def main():
             "api.test_views.BookCRUDTestCase",
             "api.test_views.BookFilteringTestCase", 
             "api.test_views.AuthorAPITestCase",
+            "api.test_views.AuthorBooksAPITestCase",
             "api.test_views.CustomEndpointsTestCase",
             "api.test_views.PermissionAndAuthenticationTestCase",
             "api.test_views.DataValidationTestCase",
             "api.test_views.ErrorHandlingTestCase"
         ]
     
-    # Run tests
+    # Run tests. The categories are independent test classes, each in its
+    # own `manage.py test` process, so they run side by side; threads are
+    # enough since they only wait on their subprocess. Every process gets
+    # its own in-memory test database (Django's default for SQLite), so
+    # concurrent runs never share one.
     all_passed = True
     results = {}
     
-    for category in test_categories:
-        verbosity = "--verbosity=2" if verbose else "--verbosity=1"
+    verbosity = "--verbosity=2" if verbose else "--verbosity=1"
+    
+    def run_category(category):
         command = f"python manage.py test {category} {verbosity}"
-        
-        success, result = run_command(command, f"Testing {category}")
+        return run_command(command, f"Testing {category}")
+    
+    max_workers = min(len(test_categories), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = list(executor.map(run_category, test_categories))
+    
+    for category, (success, result) in zip(test_categories, outcomes):
         results[category] = {
             'success': success,
             'output': result.stdout,
@@ -3,6 +3,7 @@
 
 from pathlib import Path
 import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -72,4 +73,5 @@ LOGIN_URL = '/login/'
 LOGOUT_URL = '/logout/'
 LOGIN_REDIRECT_URL = '/'
 
-print("⚙️ Base settings loaded")
+# Banner on stderr, so it stays out of piped manage.py output
+print("⚙️ Base settings loaded", file=sys.stderr)
@@ -0,0 +1,41 @@
+# Logging handlers that keep disk I/O off the request thread
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+class _BoundedQueueListener(QueueListener):
+    """QueueListener whose stop sentinel waits for room in a bounded queue."""
+    
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class BackgroundRotatingFileHandler(QueueHandler):
+    """
+    Rotating file handler whose writes happen on a background thread.
+    
+    The request thread only formats the record and puts it on a bounded
+    in-memory queue; a QueueListener thread drains it into a
+    RotatingFileHandler. When the queue is full, records below ERROR are
+    dropped rather than stalling the request, while ERROR and CRITICAL
+    records wait for room so they are never lost.
+    """
+    
+    def __init__(self, filename, maxBytes=0, backupCount=0, queue_size=10000):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        target = RotatingFileHandler(filename, maxBytes=maxBytes, backupCount=backupCount)
+        self.listener = _BoundedQueueListener(self.queue, target)
+        self.listener.start()
+        atexit.register(self.listener.stop)
+    
+    def enqueue(self, record):
+        if record.levelno >= logging.ERROR:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
@@ -0,0 +1,31 @@
+# Project middleware
+
+import time
+
+from django.conf import settings
+
+
+class SessionRefreshMiddleware:
+    """
+    Keep sessions alive on activity without saving them on every request.
+    
+    Replaces SESSION_SAVE_EVERY_REQUEST: an existing session is re-saved
+    (pushing back its expiry and the cookie's) only once a tenth of
+    SESSION_COOKIE_AGE has passed since it was last refreshed, so the idle
+    timeout still slides with user activity while read-only requests no
+    longer write the session back to the cache.
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.refresh_interval = settings.SESSION_COOKIE_AGE // 10
+    
+    def __call__(self, request):
+        response = self.get_response(request)
+        
+        session = getattr(request, 'session', None)
+        if session is not None and not session.is_empty():
+            now = int(time.time())
+            if now - session.get('_refreshed_at', 0) >= self.refresh_interval:
+                session['_refreshed_at'] = now
+        return response
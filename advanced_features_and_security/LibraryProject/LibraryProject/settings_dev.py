@@ -1,8 +1,10 @@
 # Django Environment-Specific Settings
 # Development settings with HTTPS considerations
 
+import logging
 from pathlib import Path
 import os
+import sys
 
 # Import base configuration
 try:
@@ -68,9 +70,20 @@ LOGGING = {
         'console': {
             'class': 'logging.StreamHandler',
         },
+        # Buffer DEBUG records in memory and write them to disk in batches;
+        # the buffer is flushed when full, on INFO and above (so the log can
+        # still be tailed while developing), and at exit
         'file': {
-            'class': 'logging.FileHandler',
+            'class': 'logging.handlers.MemoryHandler',
+            'capacity': 512,
+            'flushLevel': logging.INFO,
+            'target': 'file_target',
+        },
+        'file_target': {
+            'class': 'logging.handlers.RotatingFileHandler',
             'filename': 'development.log',
+            'maxBytes': 10485760,  # 10MB
+            'backupCount': 3,
         },
     },
     'root': {
@@ -121,4 +134,5 @@ CACHES = {
 # Disable password validation in development for easier testing
 AUTH_PASSWORD_VALIDATORS = []
 
-print("🔧 Development settings loaded - HTTP allowed for local development")
+# Banner on stderr, so it stays out of piped manage.py output
+print("🔧 Development settings loaded - HTTP allowed for local development", file=sys.stderr)
@@ -3,6 +3,9 @@
 
 from pathlib import Path
 import os
+import sys
+
+from .log_handlers import BackgroundRotatingFileHandler
 
 # Import base configuration
 try:
@@ -51,6 +54,8 @@ DATABASES = {
         'PASSWORD': os.getenv('DB_PASSWORD'),
         'HOST': os.getenv('DB_HOST', 'localhost'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        'CONN_MAX_AGE': 60,  # Reuse connections (and their TLS session) across requests
+        'CONN_HEALTH_CHECKS': True,  # Drop dead persistent connections before use
         'OPTIONS': {
             'sslmode': 'require',  # Require SSL for database connections
         },
@@ -75,6 +80,8 @@ EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD')
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'noreply@yourdomain.com')
 
 # Logging configuration for production
+# File handlers write from a background thread (see log_handlers.py) so
+# requests never wait on disk I/O
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -91,7 +98,7 @@ LOGGING = {
     'handlers': {
         'file': {
             'level': 'INFO',
-            'class': 'logging.handlers.RotatingFileHandler',
+            '()': BackgroundRotatingFileHandler,
             'filename': '/var/log/libraryproject/django.log',
             'maxBytes': 10485760,  # 10MB
             'backupCount': 5,
@@ -99,7 +106,7 @@ LOGGING = {
         },
         'security': {
             'level': 'INFO',
-            'class': 'logging.handlers.RotatingFileHandler',
+            '()': BackgroundRotatingFileHandler,
             'filename': '/var/log/libraryproject/security.log',
             'maxBytes': 10485760,  # 10MB
             'backupCount': 5,
@@ -130,6 +137,7 @@ MIDDLEWARE = [
     'whitenoise.middleware.WhiteNoiseMiddleware',  # For serving static files
     'csp.middleware.CSPMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'LibraryProject.middleware.SessionRefreshMiddleware',  # Sliding expiry without per-request saves
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -153,25 +161,30 @@ CONTENT_SECURITY_POLICY = {
 }
 
 # Production cache configuration (Redis recommended)
+# Django's RedisCache passes OPTIONS straight to redis-py's connection pool;
+# redis-py picks the hiredis parser automatically when hiredis is installed
+REDIS_URL = os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/1')
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.redis.RedisCache',
-        'LOCATION': os.getenv('REDIS_URL', 'redis://127.0.0.1:6379/1'),
+        'LOCATION': REDIS_URL,
         'OPTIONS': {
-            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
-            'CONNECTION_POOL_KWARGS': {
-                'ssl_cert_reqs': None,
-            }
+            'max_connections': 50,  # Cap pooled connections per process
+            'socket_connect_timeout': 3,
+            'socket_timeout': 3,
+            'socket_keepalive': True,  # Keep idle pooled connections open
         },
         'KEY_PREFIX': 'libraryproject',
     }
 }
+if REDIS_URL.startswith('rediss://'):
+    CACHES['default']['OPTIONS']['ssl_cert_reqs'] = None
 
 # Session configuration for production
 SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
 SESSION_CACHE_ALIAS = 'default'
 SESSION_COOKIE_AGE = 1800  # 30 minutes
-SESSION_SAVE_EVERY_REQUEST = True
+SESSION_SAVE_EVERY_REQUEST = False  # SessionRefreshMiddleware extends active sessions
 
 # Production password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -204,4 +217,5 @@ FILE_UPLOAD_PERMISSIONS = 0o644
 # Additional production security settings
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 
-print("🔒 Production settings loaded - Full HTTPS enforcement enabled")
+# Banner on stderr, so it stays out of piped manage.py output
+print("🔒 Production settings loaded - Full HTTPS enforcement enabled", file=sys.stderr)
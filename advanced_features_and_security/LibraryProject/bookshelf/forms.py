@@ -1,7 +1,18 @@
+import re
+
 from django import forms
 from django.core.exceptions import ValidationError
+from django.db.models import Value
+from django.db.models.functions import Lower
 from .models import Book
 
+# Markup that might indicate an XSS attempt, compiled once and matched in a
+# single case-insensitive pass
+_XSS_RE = re.compile(r'<script|javascript:|onclick\s*=|onerror\s*=', re.IGNORECASE)
+
+# Author names: letters, whitespace, hyphens and periods only
+_AUTHOR_RE = re.compile(r'\A[A-Za-z\s\-.]+\Z')
+
 
 class ExampleForm(forms.ModelForm):
     """
@@ -48,11 +59,8 @@ class ExampleForm(forms.ModelForm):
             raise ValidationError("Title cannot exceed 200 characters.")
         
         # Check for suspicious patterns that might indicate XSS attempts
-        suspicious_patterns = ['<script', 'javascript:', 'onclick=', 'onerror=']
-        title_lower = title.lower()
-        for pattern in suspicious_patterns:
-            if pattern in title_lower:
-                raise ValidationError("Title contains invalid characters.")
+        if _XSS_RE.search(title):
+            raise ValidationError("Title contains invalid characters.")
         
         return title
     
@@ -73,8 +81,7 @@ class ExampleForm(forms.ModelForm):
             raise ValidationError("Author name cannot exceed 100 characters.")
         
         # Validate that author name contains only letters, spaces, hyphens, and periods
-        import re
-        if not re.match(r'^[a-zA-Z\s\-\.]+$', author):
+        if not _AUTHOR_RE.match(author):
             raise ValidationError("Author name can only contain letters, spaces, hyphens, and periods.")
         
         return author
@@ -101,12 +108,15 @@ class ExampleForm(forms.ModelForm):
         title = cleaned_data.get('title')
         author = cleaned_data.get('author')
         
-        # Check for duplicate books
+        # Check for duplicate books, comparing LOWER(title), LOWER(author) so
+        # the lookup can use book_title_author_ci_idx
         if title and author:
-            existing_book = Book.objects.filter(
-                title__iexact=title,
-                author__iexact=author
-            ).exclude(pk=self.instance.pk if self.instance.pk else None)
+            existing_book = Book.objects.alias(
+                title_ci=Lower('title'),
+                author_ci=Lower('author')
+            ).filter(title_ci=Lower(Value(title)), author_ci=Lower(Value(author)))
+            if self.instance and self.instance.pk:
+                existing_book = existing_book.exclude(pk=self.instance.pk)
             
             if existing_book.exists():
                 raise ValidationError("A book with this title and author already exists.")
@@ -151,10 +161,7 @@ class BookSearchForm(forms.Form):
                 raise ValidationError("Search query cannot exceed 200 characters.")
             
             # Basic XSS prevention
-            suspicious_patterns = ['<script', 'javascript:', 'onclick=', 'onerror=']
-            query_lower = query.lower()
-            for pattern in suspicious_patterns:
-                if pattern in query_lower:
-                    raise ValidationError("Invalid search query.")
+            if _XSS_RE.search(query):
+                raise ValidationError("Invalid search query.")
         
         return query
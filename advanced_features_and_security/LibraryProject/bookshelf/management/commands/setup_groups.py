@@ -1,8 +1,11 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from bookshelf.models import Book
 
+_BAR = "=" * 50
+
 
 class Command(BaseCommand):
     """
@@ -16,23 +19,26 @@ class Command(BaseCommand):
         # Get the content type for Book model
         book_content_type = ContentType.objects.get_for_model(Book)
         
-        # Get or create permissions
-        permissions = {}
+        # Fetch all required permissions in a single query
         permission_codenames = ['can_view', 'can_create', 'can_edit', 'can_delete']
+        permissions = {
+            permission.codename: permission
+            for permission in Permission.objects.filter(
+                content_type=book_content_type,
+                codename__in=permission_codenames
+            )
+        }
         
-        for codename in permission_codenames:
-            try:
-                permission = Permission.objects.get(
-                    codename=codename,
-                    content_type=book_content_type
-                )
-                permissions[codename] = permission
-                self.stdout.write(f"Found permission: {codename}")
-            except Permission.DoesNotExist:
+        missing = [codename for codename in permission_codenames if codename not in permissions]
+        if missing:
+            for codename in missing:
                 self.stdout.write(
                     self.style.ERROR(f"Permission {codename} not found. Run migrations first.")
                 )
-                return
+            return
+        
+        for codename in permission_codenames:
+            self.stdout.write(f"Found permission: {codename}")
         
         # Create groups with specific permissions
         groups_config = {
@@ -41,45 +47,45 @@ class Command(BaseCommand):
             'Admins': ['can_view', 'can_create', 'can_edit', 'can_delete'],
         }
         
-        for group_name, permission_codes in groups_config.items():
-            # Get or create group
-            group, created = Group.objects.get_or_create(name=group_name)
-            
-            if created:
-                self.stdout.write(
-                    self.style.SUCCESS(f"Created group: {group_name}")
-                )
-            else:
-                self.stdout.write(f"Group already exists: {group_name}")
-            
-            # Clear existing permissions and add new ones
-            group.permissions.clear()
-            
-            for perm_code in permission_codes:
-                if perm_code in permissions:
-                    group.permissions.add(permissions[perm_code])
+        # Create all groups and their permissions in one transaction
+        with transaction.atomic():
+            for group_name, permission_codes in groups_config.items():
+                # Get or create group
+                group, created = Group.objects.get_or_create(name=group_name)
+                
+                if created:
+                    self.stdout.write(
+                        self.style.SUCCESS(f"Created group: {group_name}")
+                    )
+                else:
+                    self.stdout.write(f"Group already exists: {group_name}")
+                
+                # Replace existing permissions with the configured ones
+                group.permissions.set([permissions[perm_code] for perm_code in permission_codes])
+                
+                for perm_code in permission_codes:
                     self.stdout.write(f"  Added permission {perm_code} to {group_name}")
-            
-            group.save()
         
         self.stdout.write(
             self.style.SUCCESS('Successfully set up groups and permissions!')
         )
         
-        # Print summary
-        self.stdout.write("\n" + "="*50)
-        self.stdout.write("GROUPS AND PERMISSIONS SUMMARY:")
-        self.stdout.write("="*50)
-        
+        # Print summary and next steps in one write
+        summary_lines = [
+            "\n" + _BAR,
+            "GROUPS AND PERMISSIONS SUMMARY:",
+            _BAR,
+        ]
         for group_name, permission_codes in groups_config.items():
-            self.stdout.write(f"\n{group_name}:")
-            for perm_code in permission_codes:
-                self.stdout.write(f"  - {perm_code}")
-        
-        self.stdout.write("\n" + "="*50)
-        self.stdout.write("NEXT STEPS:")
-        self.stdout.write("1. Go to Django Admin (/admin/)")
-        self.stdout.write("2. Create test users")
-        self.stdout.write("3. Assign users to groups")
-        self.stdout.write("4. Test permissions at /bookshelf/")
-        self.stdout.write("="*50)
+            summary_lines.append(f"\n{group_name}:")
+            summary_lines.extend(f"  - {perm_code}" for perm_code in permission_codes)
+        summary_lines += [
+            "\n" + _BAR,
+            "NEXT STEPS:",
+            "1. Go to Django Admin (/admin/)",
+            "2. Create test users",
+            "3. Assign users to groups",
+            "4. Test permissions at /bookshelf/",
+            _BAR,
+        ]
+        self.stdout.write("\n".join(summary_lines))
@@ -1,16 +1,19 @@
 from django.core.management.base import BaseCommand
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.db import transaction
 
 User = get_user_model()
 
+_BAR = "=" * 60
+
 class Command(BaseCommand):
     help = 'Test Django permissions system'
     
     def handle(self, *args, **options):
-        self.stdout.write("="*60)
+        self.stdout.write(_BAR)
         self.stdout.write("DJANGO PERMISSIONS TESTING")
-        self.stdout.write("="*60)
+        self.stdout.write(_BAR)
         
         # Create test users and assign to groups
         test_users = [
@@ -19,40 +22,62 @@ class Command(BaseCommand):
             ('test_admin', 'Admins')
         ]
         
-        for username, group_name in test_users:
-            user, created = User.objects.get_or_create(
-                username=username,
-                defaults={'email': f'{username}@test.com'}
-            )
-            if created:
-                user.set_password('testpass123')
-                user.save()
-                self.stdout.write(f"✅ Created {username}")
-            
-            try:
-                group = Group.objects.get(name=group_name)
-                user.groups.add(group)
-                self.stdout.write(f"✅ Added {username} to {group_name}")
-            except Group.DoesNotExist:
-                self.stdout.write(f"❌ Group {group_name} not found")
+        usernames = [username for username, _ in test_users]
+        groups = {
+            group.name: group
+            for group in Group.objects.filter(name__in=[group_name for _, group_name in test_users])
+        }
+        existing = set(User.objects.filter(username__in=usernames).values_list('username', flat=True))
         
-        self.stdout.write("\n" + "="*60)
-        self.stdout.write("PERMISSION TEST RESULTS")
-        self.stdout.write("="*60)
+        with transaction.atomic():
+            # Create the missing users in one INSERT
+            new_users = []
+            for username in usernames:
+                if username not in existing:
+                    user = User(username=username, email=f'{username}@test.com')
+                    user.set_password('testpass123')
+                    new_users.append(user)
+            User.objects.bulk_create(new_users)
+            for user in new_users:
+                self.stdout.write(f"✅ Created {user.username}")
+            
+            # Add every user to its group in one INSERT into the membership table
+            users = User.objects.in_bulk(usernames, field_name='username')
+            Membership = User.groups.through
+            user_field = User.groups.field.m2m_field_name()
+            memberships = []
+            for username, group_name in test_users:
+                if group_name in groups:
+                    memberships.append(Membership(**{user_field: users[username], 'group': groups[group_name]}))
+                    self.stdout.write(f"✅ Added {username} to {group_name}")
+                else:
+                    self.stdout.write(f"❌ Group {group_name} not found")
+            Membership.objects.bulk_create(memberships, ignore_conflicts=True)
         
         permissions = ['bookshelf.can_view', 'bookshelf.can_create', 'bookshelf.can_edit', 'bookshelf.can_delete']
         
+        # Build the whole report and print it in one write
+        report_lines = [
+            "\n" + _BAR,
+            "PERMISSION TEST RESULTS",
+            _BAR,
+        ]
         for username, group_name in test_users:
-            try:
-                user = User.objects.get(username=username)
-                self.stdout.write(f"\n{username} ({group_name}):")
-                for perm in permissions:
-                    has_perm = user.has_perm(perm)
-                    status = "✅ HAS" if has_perm else "❌ NO"
-                    self.stdout.write(f"  {status} {perm}")
-            except User.DoesNotExist:
-                self.stdout.write(f"❌ User {username} not found")
+            user = users.get(username)
+            if user is None:
+                report_lines.append(f"❌ User {username} not found")
+                continue
+            report_lines.append(f"\n{username} ({group_name}):")
+            # Resolve the user's permissions once, then test membership
+            user_permissions = user.get_all_permissions()
+            for perm in permissions:
+                has_perm = perm in user_permissions
+                status = "✅ HAS" if has_perm else "❌ NO"
+                report_lines.append(f"  {status} {perm}")
         
-        self.stdout.write("\n" + "="*60)
-        self.stdout.write("TEST COMPLETE - Visit /bookshelf/ to test in browser!")
-        self.stdout.write("="*60)
+        report_lines += [
+            "\n" + _BAR,
+            "TEST COMPLETE - Visit /bookshelf/ to test in browser!",
+            _BAR,
+        ]
+        self.stdout.write("\n".join(report_lines))
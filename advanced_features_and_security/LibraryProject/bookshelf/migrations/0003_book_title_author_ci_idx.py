@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 03:07
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookshelf', '0002_alter_book_options'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(django.db.models.functions.text.Lower('title'), django.db.models.functions.text.Lower('author'), name='book_title_author_ci_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 
 
@@ -68,6 +69,10 @@ class Book(models.Model):
             ("can_edit", "Can edit book"),
             ("can_delete", "Can delete book"),
         ]
+        indexes = [
+            # Backs the case-insensitive duplicate check in ExampleForm.clean()
+            models.Index(Lower('title'), Lower('author'), name='book_title_author_ci_idx'),
+        ]
     
     def __str__(self):
         """Return a string representation of the book."""